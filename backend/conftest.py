@@ -0,0 +1,2 @@
+# Unit tests live in tests/; test_api.py is a smoke script run against a live server
+collect_ignore = ["test_api.py"]
@@ -0,0 +1,95 @@
+"""
+Gunicorn settings for running the API on several cores.
+
+    gunicorn -c gunicorn.conf.py main:app
+
+The app is imported once in the master process (preload_app), so the
+DataFrames, search index, precomputed schedules and pre-serialized payloads
+are built a single time. Workers are forked from the master and share those
+pages copy-on-write instead of each loading its own copy. Just before the
+first fork, everything allocated so far is moved to the garbage collector's
+permanent generation, so worker collections don't touch the shared objects
+and force the pages to be copied.
+
+Workers don't watch the data files. The master does, and when they change it
+sends itself SIGHUP. On a HUP the master reloads the data (on_reload), freezes
+it again and forks fresh workers from it, so reloaded data is shared too.
+`kill -HUP <master pid>` and POST /admin/reload trigger the same forced
+reload. Each worker keeps its own response cache and metrics.
+
+Environment variables:
+    PORT                  port to bind (default 8000)
+    WEB_CONCURRENCY       number of worker processes (default: one per usable CPU)
+    DATA_RELOAD_INTERVAL  seconds between checks of the data files (default 10, 0 disables)
+"""
+
+import gc
+import multiprocessing
+import os
+import signal
+import threading
+import time
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+if hasattr(os, "sched_getaffinity"):
+    usable_cpus = len(os.sched_getaffinity(0))
+else:
+    usable_cpus = multiprocessing.cpu_count()
+workers = int(os.environ.get("WEB_CONCURRENCY", usable_cpus))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Load the data once in the master and share it with the forked workers
+preload_app = True
+
+# Reloads happen in the master, not in each worker's own watcher
+os.environ["DATA_RELOAD_IN_MASTER"] = "1"
+
+keepalive = 5
+
+accesslog = "-"
+
+
+def freeze_loaded_objects():
+    # Freeze before forking so workers never write to the shared objects' GC headers.
+    # Unfreeze first so data replaced by a reload can still be collected.
+    gc.unfreeze()
+    gc.collect()
+    gc.freeze()
+
+
+def watch_data_files(server, interval):
+    import main
+
+    requested = None
+    while True:
+        time.sleep(interval)
+        try:
+            signature = main.changed_data_signature()
+        except Exception as e:
+            server.log.warning("Could not check the data files: %s", e)
+            continue
+        # Ask once per set of changes; on_reload does the actual work
+        if signature is not None and signature != requested:
+            requested = signature
+            server.log.info("Data files changed, reloading")
+            os.kill(server.pid, signal.SIGHUP)
+
+
+def when_ready(server):
+    freeze_loaded_objects()
+    server.log.info("Froze %d objects loaded by the master before forking workers", gc.get_freeze_count())
+
+    interval = float(os.environ.get("DATA_RELOAD_INTERVAL", "10"))
+    if interval > 0:
+        threading.Thread(target=watch_data_files, args=(server, interval), name="data-watcher", daemon=True).start()
+
+
+def on_reload(server):
+    # Runs in the master on SIGHUP, before the new workers are forked
+    import main
+
+    if main.reload_data(force=True):
+        freeze_loaded_objects()
+        server.log.info("Reloaded data version %d for the new workers", main.dataset.version)
+    else:
+        server.log.warning("Data reload failed; new workers keep the previous data")
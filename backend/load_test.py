@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Load test for the Trinity College Orientation Leaders API
+
+Drives the API with a weighted mix of requests across every endpoint at
+increasing concurrency and reports throughput and p50/p95/p99 latency per
+level. By default the real `app` is loaded in-process and called through
+httpx's ASGI transport (no network, no server), with the app's startup and
+shutdown handlers run around the test so settings such as THREADPOOL_SIZE
+apply as in a deployed server; pass --url to test a running server
+instead, e.g. several gunicorn workers.
+
+Lookups follow a realistic distribution: a few leaders are looked up far
+more than others, and queries are a mix of full names, first or last names,
+partial names typed into the search box, emails and misses.
+
+Usage:
+    python load_test.py                                  # in-process, concurrency 1 8 32 128
+    python load_test.py --concurrency 16 64 --requests 5000
+    python load_test.py --url http://localhost:8000 --bypass-cache --output results.json
+
+Requires httpx (pip install httpx).
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+try:
+    import httpx
+except ImportError:  # only needed for load testing
+    httpx = None
+
+# Share of requests going to each kind of endpoint
+ENDPOINT_WEIGHTS = {
+    "lookup": 35,
+    "leader_details": 10,
+    "event_leaders": 10,
+    "leader_assignments": 15,
+    "event_staffing_filtered": 5,
+    "static": 20,
+    "health": 5,
+}
+
+STATIC_ENDPOINTS = ["/api/leaders", "/api/events", "/api/summary", "/api/event-staffing"]
+
+# How people search for a leader
+LOOKUP_STYLES = {
+    "full_name": 40,
+    "first_name": 20,
+    "last_name": 10,
+    "prefix": 15,
+    "email": 5,
+    "miss": 10,
+}
+
+
+class RequestMix:
+    """Generates request paths from the leaders and events the API serves."""
+
+    def __init__(self, leaders: List[Dict], events: List[Dict], seed: int = 0):
+        self.rng = random.Random(seed)
+        self.leaders = leaders
+        self.events = events
+        self.dates = sorted({event["date"] for event in events if event.get("date")})
+        # Zipf-like popularity: the first leaders in a shuffled order get most lookups
+        order = list(range(len(leaders)))
+        self.rng.shuffle(order)
+        self.leader_order = order
+        self.leader_weights = [1 / (rank + 1) ** 1.1 for rank in range(len(order))]
+
+    def _leader(self) -> Dict:
+        return self.leaders[self.rng.choices(self.leader_order, self.leader_weights)[0]]
+
+    def _event(self) -> Dict:
+        return self.rng.choice(self.events)
+
+    def lookup_query(self) -> str:
+        leader = self._leader()
+        names = leader["full_name"].split()
+        first, last = names[0], names[-1]
+        style = self.rng.choices(list(LOOKUP_STYLES), list(LOOKUP_STYLES.values()))[0]
+        if style == "full_name":
+            query = f"{first} {last}"
+        elif style == "first_name":
+            query = first
+        elif style == "last_name":
+            query = last
+        elif style == "prefix":
+            # The API rejects searches shorter than 3 characters
+            query = first[:self.rng.randint(3, max(3, min(5, len(first))))]
+        elif style == "email":
+            query = leader["email"]
+        else:
+            query = "".join(self.rng.choices("bcdfghjklmnpqrstvwxz", k=6))
+        return query.lower() if self.rng.random() < 0.5 else query
+
+    def next(self) -> Tuple[str, str]:
+        """(endpoint kind, path with query string)"""
+        kind = self.rng.choices(list(ENDPOINT_WEIGHTS), list(ENDPOINT_WEIGHTS.values()))[0]
+        rng = self.rng
+
+        if kind == "lookup":
+            path = f"/api/lookup/{quote(self.lookup_query())}"
+            if rng.random() < 0.3:
+                path += "?limit=10"
+        elif kind == "leader_details":
+            path = f"/api/leader/{quote(self._leader()['email'])}"
+        elif kind == "event_leaders":
+            path = f"/api/event/{quote(self._event()['Event'], safe='')}/leaders"
+        elif kind == "leader_assignments":
+            choice = rng.random()
+            if choice < 0.4:
+                path = f"/api/leader-assignments?leader_email={quote(self._leader()['email'])}"
+            elif choice < 0.7:
+                path = f"/api/leader-assignments?event={quote(self._event()['Event'])}"
+            elif choice < 0.9 and self.dates:
+                path = f"/api/leader-assignments?date={quote(rng.choice(self.dates))}"
+            else:
+                path = f"/api/leader-assignments?min_hours={rng.choice([1, 2, 3])}"
+        elif kind == "event_staffing_filtered":
+            path = rng.choice([
+                "/api/event-staffing?fully_staffed=true",
+                "/api/event-staffing?fully_staffed=false",
+                f"/api/event-staffing?min_duration={rng.choice([1, 1.5, 2])}",
+                f"/api/event-staffing?time_slot={quote(rng.choice(['am', 'pm', '12:']))}",
+            ])
+        elif kind == "static":
+            path = rng.choice(STATIC_ENDPOINTS)
+        else:
+            path = "/health"
+        return kind, path
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    if not latencies:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    values = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2),
+        "p99_ms": round(float(p99), 2),
+        "max_ms": round(float(values.max()), 2)
+    }
+
+
+async def run_level(client, mix: RequestMix, concurrency: int, total_requests: int,
+                    bypass_cache: bool) -> Dict:
+    """Send total_requests requests from `concurrency` concurrent workers"""
+    requests = [mix.next() for _ in range(total_requests)]
+    pending = iter(requests)
+    counter = itertools.count()
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[int, int] = defaultdict(int)
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for kind, path in pending:
+            if bypass_cache:
+                path += ("&" if "?" in path else "?") + f"_={next(counter)}"
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                await response.aread()
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies[kind].append(time.perf_counter() - started)
+            statuses[response.status_code] += 1
+            if response.status_code >= 500:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "concurrency": concurrency,
+        "requests": total_requests,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(total_requests / elapsed, 1) if elapsed else 0.0,
+        **percentiles(all_latencies),
+        "errors": errors,
+        "status_codes": {str(status): count for status, count in sorted(statuses.items())},
+        "endpoints": {kind: {"requests": len(values), **percentiles(values)}
+                      for kind, values in sorted(latencies.items())}
+    }
+
+
+@asynccontextmanager
+async def make_client(url: str = None, max_connections: int = 100):
+    if url:
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+            yield client
+        return
+
+    # Importing main loads the data, just as server startup does
+    from main import app
+
+    # ASGITransport sends no lifespan events, so run the startup handlers
+    # (threadpool size, data watcher) on this event loop ourselves
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=30.0) as client:
+            yield client
+
+
+async def load_test(url: str, levels: List[int], requests_per_level: int, seed: int,
+                    bypass_cache: bool, warmup: int) -> Dict:
+    async with make_client(url, max(levels)) as client:
+        leaders = (await client.get("/api/leaders")).json()["leaders"]
+        events = (await client.get("/api/events")).json()["events"]
+        mix = RequestMix(leaders, events, seed)
+
+        if warmup:
+            await run_level(client, mix, min(8, max(levels)), warmup, bypass_cache)
+
+        results = []
+        for concurrency in levels:
+            result = await run_level(client, mix, concurrency, requests_per_level, bypass_cache)
+            results.append(result)
+            print(f"{concurrency:>11}  {result['throughput_rps']:>10.1f}  {result['p50_ms']:>8.2f}  "
+                  f"{result['p95_ms']:>8.2f}  {result['p99_ms']:>8.2f}  {result['max_ms']:>8.2f}  {result['errors']:>6}")
+
+    return {
+        "target": url or "in-process",
+        "requests_per_level": requests_per_level,
+        "bypass_cache": bypass_cache,
+        "leaders": len(leaders),
+        "events": len(events),
+        "levels": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the orientation leaders API")
+    parser.add_argument("--url", help="base URL of a running server (default: load the app in-process)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128],
+                        help="concurrency levels to test (default: 1 8 32 128)")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per concurrency level (default: 2000)")
+    parser.add_argument("--warmup", type=int, default=200, help="untimed requests before the first level (default: 200)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the request mix")
+    parser.add_argument("--bypass-cache", action="store_true",
+                        help="add a unique query parameter to every request so the response cache never hits")
+    parser.add_argument("--by-endpoint", action="store_true", help="also print latency per endpoint kind")
+    parser.add_argument("--output", help="write the full results as JSON to this file")
+    args = parser.parse_args()
+
+    if httpx is None:
+        parser.error("httpx is required for load testing: pip install httpx")
+
+    print("🚀 Trinity College Orientation Leaders API - Load Test")
+    print("=" * 60)
+    print(f"{'concurrency':>11}  {'req/s':>10}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}  {'max ms':>8}  {'errors':>6}")
+
+    report = asyncio.run(load_test(args.url, args.concurrency, args.requests, args.seed,
+                                   args.bypass_cache, args.warmup))
+
+    if args.by_endpoint:
+        for level in report["levels"]:
+            print(f"\nConcurrency {level['concurrency']}:")
+            for kind, stats in level["endpoints"].items():
+                print(f"  {kind:<24} {stats['requests']:>6}  p50 {stats['p50_ms']:>7.2f}  "
+                      f"p95 {stats['p95_ms']:>7.2f}  p99 {stats['p99_ms']:>7.2f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
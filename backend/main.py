@@ -1,20 +1,62 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from anyio import to_thread
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+import numpy as np
 import pandas as pd
+import hashlib
+import importlib
+import importlib.util
 import os
+import signal
 import sys
-from typing import List, Dict, Optional
+import threading
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, Metrics, MetricsMiddleware, counter_lines
+from payloads import JSONPayload, dumps
+from query_index import QueryPlanner, SortedColumnIndex, intersect_rows, mask_rows, take_rows
+from response_cache import ResponseCache, ResponseCacheMiddleware
+from search_index import LeaderSearchIndex
+
 # Add the parent directory to the path so we can import from scripts
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    from scripts.data_snapshot import SNAPSHOT_FILE, read_snapshot
+except ImportError:
+    SNAPSHOT_FILE, read_snapshot = None, None
+
+try:
+    from scripts.generate_meal_eligibility import ELIGIBILITY_COLUMNS, compute_meal_eligibility
+except ImportError:
+    ELIGIBILITY_COLUMNS, compute_meal_eligibility = None, None
+
+try:
+    from scripts.times import times_to_minutes
+except ImportError:
+    times_to_minutes = None
+
+# The schedule is watched like the data files, so editing it takes effect on the next reload
+try:
+    _schedule_spec = importlib.util.find_spec("scripts.orientation_schedule")
+except ImportError:
+    _schedule_spec = None
+SCHEDULE_FILE = _schedule_spec.origin if _schedule_spec is not None else None
+
 app = FastAPI(
     title="Trinity College Orientation Leaders API",
     description="API for serving orientation leader assignments, event staffing, and summary data",
     version="1.0.0"
 )
 
+# Cache read-only API responses in process; they only change when the data is reloaded.
+# Added before CORS so CORS headers are computed per request around cached replays.
+response_cache = ResponseCache(max_entries=int(os.environ.get("RESPONSE_CACHE_SIZE", "2048")))
+app.add_middleware(ResponseCacheMiddleware, cache=response_cache)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -24,96 +66,710 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency and per-stage timings for /metrics. Added last so it is the
+# outermost middleware and also times cache hits; METRICS_ENABLED=0 turns it off.
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") != "0"
+request_metrics = Metrics(enabled=METRICS_ENABLED)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, metrics=request_metrics, router=app.router)
+
+LEADERS_CSV = "Trinity College Orientation Leaders 2025(Simplified).csv"
+
+# Columns served by /api/leader-assignments; the loader adds derived columns after these
+ASSIGNMENT_COLUMNS = ['Leader Email', 'Event', 'Date', 'Start Time', 'End Time', 'Hours']
+# Repeated strings stored once per distinct value, with int codes per row
+ASSIGNMENT_CATEGORICAL_COLUMNS = ['Leader Email', 'Event', 'Date', 'Start Time', 'End Time']
+
+# Columns /api/leader-assignments filters on: by value or substring, and by range
+ASSIGNMENT_FILTER_COLUMNS = ['Leader Email', 'Event', 'Date']
+ASSIGNMENT_RANGE_COLUMNS = ['Hours']
+
+ASSIGNMENT_CSV_FILES = [
+    "enhanced_orientation_assignments_leader_assignments.csv",
+    "enhanced_orientation_assignments_event_staffing.csv", 
+    "enhanced_orientation_assignments_summary.csv",
+    "enhanced_orientation_assignments_meal_eligibility.csv"
+]
+
+class OrientationData:
+    """
+    Everything the API serves, loaded and indexed together.
+    
+    A loaded instance is never mutated; reloads build a new instance and
+    swap the module-level `dataset` reference, so a handler that reads
+    `dataset` once sees one consistent version for the whole request.
+    """
+    
+    def __init__(self):
+        self.base_dir = None
+        self.source_signature = None
+        self.version = 0
+        self.loaded_at = None
+        self.assignments_df = None
+        self.events_df = None
+        self.summary_df = None
+        self.meal_eligibility_df = None
+        # Indexes over the assignment filter columns, and row positions sorted by 'Duration (hours)'
+        self.assignment_query = QueryPlanner(pd.DataFrame())
+        self.duration_index = SortedColumnIndex([])
+        # Meal name -> (inputs it was computed from, eligibility table), reused by reloads
+        self.meal_eligibility_by_meal = {}
+        self.orientation_events = {}
+        self.leader_directory = {}
+        self.leader_schedules = {}
+        self.search_index = LeaderSearchIndex([])
+        self.event_leaders = {}
+        self.event_name_index = {}
+        self.static_payloads = {}
+    
+    @property
+    def loaded(self) -> bool:
+        return self.assignments_df is not None
+
+def find_data_dir() -> Optional[str]:
+    """Return the first candidate directory that contains the assignment data"""
+    # An explicit DATA_DIR skips probing entirely
+    if os.environ.get("DATA_DIR"):
+        return os.environ["DATA_DIR"]
+    
+    # Try multiple possible locations
+    possible_base_dirs = [
+        ".",  # Current directory (backend/ on Railway)
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),  # From backend/ -> project root
+        os.getcwd(),  # Current working directory 
+        os.path.dirname(os.getcwd()),  # Parent of current directory
+        ".."  # Parent directory
+    ]
+    
+    for potential_dir in possible_base_dirs:
+        if os.path.exists(os.path.join(potential_dir, ASSIGNMENT_CSV_FILES[0])):
+            return potential_dir
+        if SNAPSHOT_FILE and os.path.exists(os.path.join(potential_dir, SNAPSHOT_FILE)):
+            return potential_dir
+    
+    print(f"❌ Could not find CSV files in any of these locations:")
+    for potential_dir in possible_base_dirs:
+        print(f"   - {os.path.abspath(potential_dir)}")
+    return None
+
+def file_stamp(path: str):
+    """(mtime, size) of a file, or (None, None) if it does not exist"""
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None, None
+
+def data_signature(base_dir: str):
+    """(name, mtime, size) of every source file, used to detect changed data"""
+    signature = []
+    for filename in ASSIGNMENT_CSV_FILES + [LEADERS_CSV, SNAPSHOT_FILE]:
+        if filename is None:
+            continue
+        signature.append((filename, *file_stamp(os.path.join(base_dir, filename))))
+    if SCHEDULE_FILE is not None:
+        signature.append((SCHEDULE_FILE, *file_stamp(SCHEDULE_FILE)))
+    return tuple(signature)
+
+_schedule_stamp = None
+
+def load_orientation_schedule():
+    """
+    The scripts.orientation_schedule module, re-imported if its file changed
+    since the last load, or None if it is not available.
+    """
+    global _schedule_stamp
+    try:
+        import scripts.orientation_schedule as schedule
+    except ImportError:
+        return None
+    stamp = file_stamp(schedule.__file__)
+    if _schedule_stamp is not None and stamp != _schedule_stamp:
+        schedule = importlib.reload(schedule)
+    _schedule_stamp = stamp
+    return schedule
+
 # Load the data files
-def load_data():
-    """Load the orientation data from CSV files"""
+def load_data(base_dir: Optional[str] = None, previous: Optional[OrientationData] = None) -> OrientationData:
+    """
+    Load the orientation data from CSV files and build every index.
+    
+    Meal eligibility tables from `previous` are reused for meals whose
+    inputs did not change.
+    """
+    data = OrientationData()
     try:
         # Get the base directory - try multiple possible locations
-        possible_base_dirs = [
-            ".",  # Current directory (backend/ on Railway)
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),  # From backend/ -> project root
-            os.getcwd(),  # Current working directory 
-            os.path.dirname(os.getcwd()),  # Parent of current directory
-            ".."  # Parent directory
-        ]
-        
-        base_dir = None
-        csv_files = [
-            "enhanced_orientation_assignments_leader_assignments.csv",
-            "enhanced_orientation_assignments_event_staffing.csv", 
-            "enhanced_orientation_assignments_summary.csv",
-            "enhanced_orientation_assignments_meal_eligibility.csv"
-        ]
-        
-        # Find the directory that contains our CSV files
-        for potential_dir in possible_base_dirs:
-            test_file = os.path.join(potential_dir, csv_files[0])
-            if os.path.exists(test_file):
-                base_dir = potential_dir
-                print(f"✅ Found CSV files in: {base_dir}")
-                break
-        
         if base_dir is None:
-            print(f"❌ Could not find CSV files in any of these locations:")
-            for potential_dir in possible_base_dirs:
-                print(f"   - {os.path.abspath(potential_dir)}")
+            base_dir = find_data_dir()
+        if base_dir is None:
             raise FileNotFoundError("CSV files not found")
         
+        print(f"✅ Found CSV files in: {base_dir}")
         print(f"🔍 Using base directory: {os.path.abspath(base_dir)}")
         print(f"📁 Current working directory: {os.getcwd()}")
         
-        # Load all four CSV files from project root (enhanced versions)
-        assignments_df = pd.read_csv(os.path.join(base_dir, "enhanced_orientation_assignments_leader_assignments.csv"))
-        events_df = pd.read_csv(os.path.join(base_dir, "enhanced_orientation_assignments_event_staffing.csv"))
-        summary_df = pd.read_csv(os.path.join(base_dir, "enhanced_orientation_assignments_summary.csv"))
+        # Take the signature before reading so a write during the load triggers another reload
+        data.base_dir = base_dir
+        data.source_signature = data_signature(base_dir)
         
-        # Load meal eligibility data
-        try:
-            meal_eligibility_df = pd.read_csv(os.path.join(base_dir, "enhanced_orientation_assignments_meal_eligibility.csv"))
-        except Exception as e:
-            print(f"Warning: Could not load meal eligibility data: {e}")
+        # Prefer the memory-mapped binary snapshot written by scripts/assignment.py
+        frames = None
+        if read_snapshot is not None:
+            try:
+                frames = read_snapshot(base_dir)
+            except Exception as e:
+                print(f"Warning: Could not read data snapshot, falling back to CSV: {e}")
+        
+        if frames is not None:
+            print("⚡ Loaded data from binary snapshot")
+            assignments_df = frames["assignments"]
+            events_df = frames["events"]
+            summary_df = frames["summary"]
+            meal_eligibility_df = frames.get("meal_eligibility")
+            leaders_df = frames.get("leaders")
+        else:
+            # Load all four CSV files from project root (enhanced versions)
+            assignments_df = pd.read_csv(os.path.join(base_dir, "enhanced_orientation_assignments_leader_assignments.csv"))
+            events_df = pd.read_csv(os.path.join(base_dir, "enhanced_orientation_assignments_event_staffing.csv"))
+            summary_df = pd.read_csv(os.path.join(base_dir, "enhanced_orientation_assignments_summary.csv"))
+            
+            # Meal eligibility is computed below; the generated file is only a fallback
             meal_eligibility_df = None
+            if compute_meal_eligibility is None:
+                try:
+                    meal_eligibility_df = pd.read_csv(os.path.join(base_dir, "enhanced_orientation_assignments_meal_eligibility.csv"))
+                except Exception as e:
+                    print(f"Warning: Could not load meal eligibility data: {e}")
+            
+            try:
+                leaders_df = pd.read_csv(os.path.join(base_dir, LEADERS_CSV))
+            except Exception as e:
+                print(f"Warning: Could not load leader roster: {e}")
+                leaders_df = None
+        
+        # Compact representation: categorical strings plus integer times
+        assignments_df = prepare_assignments(assignments_df)
+        
+        # Value, substring and range indexes for the assignment filters;
+        # presorted row positions so duration ranges are binary searches
+        assignment_query = QueryPlanner(assignments_df, ASSIGNMENT_FILTER_COLUMNS, ASSIGNMENT_RANGE_COLUMNS)
+        duration_index = SortedColumnIndex(events_df['Duration (hours)'])
         
         # Load the original orientation schedule for additional details
-        try:
-            from scripts.orientation_schedule import ORIENTATION_EVENTS
-        except ImportError:
-            ORIENTATION_EVENTS = {}
+        schedule = load_orientation_schedule()
+        ORIENTATION_EVENTS = schedule.ORIENTATION_EVENTS if schedule is not None else {}
+        
+        # Which leaders can eat at each of the schedule's meals
+        meal_eligibility_by_meal = {}
+        if schedule is not None and compute_meal_eligibility is not None:
+            meal_eligibility_df, meal_eligibility_by_meal = build_meal_eligibility(
+                assignments_df, schedule.get_meal_events(),
+                previous.meal_eligibility_by_meal if previous is not None else None
+            )
+        
+        # Index the leader roster once so handlers never re-read it per request
+        leader_directory = build_leader_directory(leaders_df)
         
-        return assignments_df, events_df, summary_df, meal_eligibility_df, ORIENTATION_EVENTS
+        # Materialize every leader's schedule response up front
+        leader_schedules = build_leader_schedules(
+            assignments_df, events_df, meal_eligibility_df, ORIENTATION_EVENTS, leader_directory
+        )
+        
+        # Index the names and emails of every leader that can be looked up
+        search_index = build_search_index(leader_directory, leader_schedules)
+        
+        # Materialize every event's leader list, joined with the leader directory once
+        event_leaders, event_name_index = build_event_leaders(
+            assignments_df, events_df, ORIENTATION_EVENTS, leader_directory
+        )
+        
+        # Encode the payloads that never vary between requests once
+        static_payloads = build_static_payloads(
+            assignments_df, events_df, summary_df, ORIENTATION_EVENTS, leader_directory
+        )
     except Exception as e:
         print(f"Error loading data: {e}")
-        return None, None, None, None, {}
+        return data
+    
+    data.assignments_df = assignments_df
+    data.events_df = events_df
+    data.summary_df = summary_df
+    data.assignment_query = assignment_query
+    data.duration_index = duration_index
+    data.meal_eligibility_df = meal_eligibility_df
+    data.meal_eligibility_by_meal = meal_eligibility_by_meal
+    data.orientation_events = ORIENTATION_EVENTS
+    data.leader_directory = leader_directory
+    data.leader_schedules = leader_schedules
+    data.search_index = search_index
+    data.event_leaders = event_leaders
+    data.event_name_index = event_name_index
+    data.static_payloads = static_payloads
+    data.loaded_at = datetime.now().isoformat(timespec="seconds")
+    return data
 
-# Helper function to get base directory
-def get_base_dir():
-    # Try to find the directory with CSV files
-    possible_base_dirs = [
-        ".",  # Current directory (backend/ on Railway)
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),  # From backend/ -> project root
-        os.getcwd(),  # Current working directory 
-        os.path.dirname(os.getcwd()),  # Parent of current directory
-        ".."  # Parent directory
-    ]
+def prepare_assignments(assignments_df):
+    """
+    Convert repeated string columns to categoricals and add integer
+    'Start Minutes' / 'End Minutes' columns (minutes since midnight), which
+    meal eligibility reads instead of parsing the time strings.
     
-    # Test with a known CSV file
-    test_file = "enhanced_orientation_assignments_leader_assignments.csv"
-    for potential_dir in possible_base_dirs:
-        if os.path.exists(os.path.join(potential_dir, test_file)):
-            return potential_dir
+    Times are parsed once per distinct value rather than once per row.
+    """
+    # Shallow copy: new columns are added without touching (possibly memory-mapped) source arrays
+    assignments_df = assignments_df.copy(deep=False)
+    for column in ASSIGNMENT_CATEGORICAL_COLUMNS:
+        if not isinstance(assignments_df[column].dtype, pd.CategoricalDtype):
+            assignments_df[column] = assignments_df[column].astype('category')
+    
+    if times_to_minutes is not None:
+        for time_column, minutes_column in (('Start Time', 'Start Minutes'), ('End Time', 'End Minutes')):
+            assignments_df[minutes_column] = times_to_minutes(assignments_df[time_column]).astype(np.int16)
+    return assignments_df
+
+def build_leader_directory(leaders_df) -> Dict[str, Dict]:
+    """
+    Build an in-memory leader directory keyed by email from the roster.
+    
+    Each entry keeps the first and last name plus the original roster row.
+    The first row wins when an email appears more than once, matching the
+    previous per-request `.iloc[0]` lookups.
+    """
+    if leaders_df is None:
+        return {}
+    
+    directory = {}
+    for row in leaders_df.to_dict('records'):
+        email = row.get('Email')
+        if not isinstance(email, str) or email in directory:
+            continue
+        first_name = row.get('First Name')
+        last_name = row.get('Last Name')
+        directory[email] = {
+            "first_name": first_name if isinstance(first_name, str) else "",
+            "last_name": last_name if isinstance(last_name, str) else "",
+            "record": row
+        }
+    return directory
+
+def build_meal_eligibility(assignments_df, meal_events: Dict,
+                           previous: Optional[Dict] = None) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Meal eligibility for every meal, computed one meal at a time.
+    
+    A meal's table depends only on its date and times and that day's
+    assignments, so a table in `previous` (from the last load) is reused
+    when neither changed. Returns the combined table and the per-meal
+    tables to pass to the next load.
+    """
+    previous = previous or {}
+    rows_by_date = assignments_df.groupby('Date', observed=True).indices
+    # Digest of each day's assignments, in order, to tell which days changed
+    row_hashes = pd.util.hash_pandas_object(
+        assignments_df[['Leader Email', 'Start Time', 'End Time']], index=False
+    ).to_numpy()
+    
+    meal_tables = {}
+    recomputed = 0
+    for meal_name, meal in meal_events.items():
+        rows = rows_by_date.get(meal['date'])
+        day_digest = hashlib.blake2b(row_hashes[rows].tobytes(), digest_size=16).digest() if rows is not None else None
+        key = (meal['date'], meal['start_time'], meal['end_time'], day_digest)
+        
+        cached = previous.get(meal_name)
+        if cached is not None and cached[0] == key:
+            meal_tables[meal_name] = cached
+            continue
+        
+        day_assignments = assignments_df.iloc[rows] if rows is not None else assignments_df.iloc[:0]
+        meal_tables[meal_name] = (key, compute_meal_eligibility(day_assignments, {meal_name: meal}))
+        recomputed += 1
+    
+    tables = [table for _, table in meal_tables.values() if not table.empty]
+    combined = pd.concat(tables, ignore_index=True) if tables else pd.DataFrame(columns=ELIGIBILITY_COLUMNS)
+    print(f"🍽️ Meal eligibility: computed {recomputed} of {len(meal_events)} meals, {len(combined)} records")
+    return combined, meal_tables
+
+def build_leader_schedules(assignments_df, events_df, meal_eligibility_df,
+                           orientation_events: Dict, leader_directory: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Precompute the per-leader responses served by /api/lookup and /api/leader.
+    
+    Returns a dict keyed by leader email (in assignment order) with a
+    "lookup" and a "details" response body for every leader that has at
+    least one assignment, so each request is a single hash lookup.
+    """
+    # Group assignment rows by leader once, preserving file order
+    assignments_by_leader = {}
+    for assignment in assignments_df.to_dict('records'):
+        assignments_by_leader.setdefault(assignment['Leader Email'], []).append(assignment)
+    
+    # First staffing row per event, as the per-request filter used to pick
+    staffing_by_event = {}
+    if events_df is not None:
+        for event_row in events_df.to_dict('records'):
+            staffing_by_event.setdefault(event_row['Event'], event_row)
+    
+    meals_by_leader = {}
+    if meal_eligibility_df is not None:
+        for meal_row in meal_eligibility_df.to_dict('records'):
+            meals_by_leader.setdefault(meal_row['Eligible Leader'], []).append(meal_row)
+    
+    schedules = {}
+    for leader_email, leader_assignments in assignments_by_leader.items():
+        leader_info = leader_directory.get(leader_email)
+        if leader_info is not None:
+            leader_full_name = f"{leader_info['first_name']} {leader_info['last_name']}"
+            leader_details = dict(leader_info['record'])
+        else:
+            leader_full_name = leader_email
+            leader_details = {"Email": leader_email}
+        
+        # Events as shown by the name lookup
+        lookup_events = []
+        # Events as shown by the email details endpoint
+        detail_events = []
+        for assignment in leader_assignments:
+            event_name = assignment['Event']
+            event_details = orientation_events.get(event_name, {})
+            lookup_events.append({
+                "event_name": event_name,
+                "date": assignment['Date'],
+                "start_time": assignment['Start Time'],
+                "end_time": assignment['End Time'],
+                "duration_hours": assignment['Hours'],
+                "location": event_details.get('location', 'Location not specified')
+            })
+            
+            event_info = staffing_by_event.get(event_name)
+            if event_info is not None:
+                time_slot = event_info['Time Slot']
+                duration = event_info['Duration (hours)']
+            else:
+                time_slot = assignment['Start Time'] + " - " + assignment['End Time']
+                duration = assignment['Hours']
+            detail_events.append({
+                "event_name": event_name,
+                "date": assignment['Date'],
+                "start_time": assignment['Start Time'],
+                "end_time": assignment['End Time'],
+                "time_slot": time_slot,
+                "duration_hours": duration
+            })
+        
+        # Sort events by date and time
+        lookup_events.sort(key=lambda x: (x['date'], x['start_time']))
+        detail_events.sort(key=lambda x: (x['date'], x['start_time']))
+        
+        meal_eligibility = []
+        for meal_row in meals_by_leader.get(leader_email, []):
+            meal_name = meal_row['Meal Event']
+            meal_details = orientation_events.get(meal_name, {})
+            meal_eligibility.append({
+                "meal_name": meal_name,
+                "date": meal_details.get('date', 'Unknown'),
+                "start_time": meal_details.get('start_time', 'Unknown'),
+                "end_time": meal_details.get('end_time', 'Unknown'),
+                "location": meal_details.get('location', 'Unknown'),
+                "reason": meal_row['Reason']
+            })
+        meal_eligibility.sort(key=lambda x: (x['date'], x['start_time']))
+        
+        total_hours = sum(assignment['Hours'] for assignment in leader_assignments)
+        event_count = len(leader_assignments)
+        
+        schedules[leader_email] = {
+            "lookup": {
+                "leader_name": leader_full_name,
+                "leader_email": leader_email,
+                "total_events": len(lookup_events),
+                "total_hours": sum(event['duration_hours'] for event in lookup_events),
+                "events": lookup_events,
+                "meal_eligibility": meal_eligibility
+            },
+            "details": {
+                "leader_details": leader_details,
+                "statistics": {
+                    "total_events": event_count,
+                    "total_hours": total_hours,
+                    "average_hours_per_event": total_hours / event_count if event_count > 0 else 0
+                },
+                "assignments": detail_events
+            }
+        }
+    
+    return schedules
+
+def build_search_index(leader_directory: Dict[str, Dict], leader_schedules: Dict[str, Dict]) -> LeaderSearchIndex:
+    """Build the lookup search index over leaders that have a schedule"""
+    leaders = []
+    for leader_email in leader_schedules:
+        leader_info = leader_directory.get(leader_email, {})
+        leaders.append((
+            leader_email,
+            leader_info.get('first_name', ''),
+            leader_info.get('last_name', '')
+        ))
+    return LeaderSearchIndex(leaders)
+
+def build_event_leaders(assignments_df, events_df, orientation_events: Dict,
+                        leader_directory: Dict[str, Dict]):
+    """
+    Precompute the /api/event/{event_name}/leaders response for every event.
+    
+    Returns:
+        (event_leaders, event_name_index) where event_leaders maps each
+        canonical event name (in order of first assignment) to its response
+        body, and event_name_index maps casefolded names to canonical ones.
+    """
+    # Group assignment rows by event once, preserving file order
+    assignments_by_event = {}
+    for assignment in assignments_df.to_dict('records'):
+        assignments_by_event.setdefault(assignment['Event'], []).append(assignment)
+    
+    staffing_by_event = {}
+    if events_df is not None:
+        for event_row in events_df.to_dict('records'):
+            staffing_by_event.setdefault(event_row['Event'], event_row)
+    
+    event_leaders = {}
+    event_name_index = {}
+    for event_name, event_assignments in assignments_by_event.items():
+        event_name_index.setdefault(event_name.casefold(), event_name)
+        
+        # Build leader list with details from the leader directory
+        leaders = []
+        for assignment in event_assignments:
+            leader_email = assignment['Leader Email']
+            leader_info = leader_directory.get(leader_email)
+            if leader_info is not None:
+                leaders.append({
+                    "name": f"{leader_info['first_name']} {leader_info['last_name']}",
+                    "email": leader_email,
+                    "first_name": leader_info['first_name'],
+                    "last_name": leader_info['last_name']
+                })
+            else:
+                leaders.append({
+                    "name": leader_email,
+                    "email": leader_email,
+                    "first_name": "",
+                    "last_name": ""
+                })
+        
+        # Sort leaders by name
+        leaders.sort(key=lambda x: x['name'])
+        
+        first_assignment = event_assignments[0]
+        event_details = orientation_events.get(event_name, {})
+        event_leaders[event_name] = {
+            "event_name": event_name,
+            "event_details": {
+                "date": first_assignment['Date'],
+                "start_time": first_assignment['Start Time'],
+                "end_time": first_assignment['End Time'],
+                "duration_hours": first_assignment['Hours'],
+                "location": event_details.get('location', 'Location not specified')
+            },
+            "staffing_info": staffing_by_event.get(event_name, {}),
+            "total_leaders": len(leaders),
+            "leaders": leaders
+        }
+    
+    return event_leaders, event_name_index
+
+def build_leaders_response(assignments_df, leader_directory: Dict[str, Dict]) -> Dict:
+    """Build the /api/leaders body: every leader with their assignment statistics"""
+    # Get unique leaders and their assignment counts
+    leader_stats = assignments_df.groupby('Leader Email', observed=True).agg({
+        'Event': 'count',
+        'Hours': 'sum'
+    }).reset_index()
+    
+    leader_stats.columns = ['email', 'event_count', 'total_hours']
+    
+    # Add names from the leader directory, falling back to the email
+    def full_name(email):
+        leader = leader_directory.get(email)
+        if leader is None:
+            return email
+        name = f"{leader['first_name']} {leader['last_name']}".strip()
+        return name or email
+    
+    leader_stats['full_name'] = leader_stats['email'].map(full_name)
+    
+    # Sort by total hours (descending)
+    leader_stats = leader_stats.sort_values('total_hours', ascending=False)
+    
+    return {
+        "total_leaders": len(leader_stats),
+        "leaders": leader_stats[['full_name', 'email', 'event_count', 'total_hours']].to_dict('records')
+    }
+
+def build_events_response(events_df, orientation_events: Dict) -> Dict:
+    """Build the /api/events body: every event enriched with schedule details"""
+    # Sort by date and time for better organization
+    events_sorted = events_df.sort_values(['Time Slot', 'Event'])
+    
+    # Enrich events with type information from orientation_schedule.py
+    enriched_events = []
+    for _, event_row in events_sorted.iterrows():
+        event_dict = event_row.to_dict()
+        event_name = event_dict['Event']
+        
+        # Get additional event details from orientation schedule
+        event_details = orientation_events.get(event_name, {})
+        
+        # Add type information
+        event_dict['is_meal'] = event_details.get('is_meal', False)
+        event_dict['is_indoor'] = event_details.get('is_indoor', False)
+        event_dict['is_outdoor'] = event_details.get('is_outdoor', False)
+        event_dict['is_core'] = event_details.get('is_core', False)
+        event_dict['location'] = event_details.get('location', '')
+        event_dict['date'] = event_details.get('date', '')
+        event_dict['start_time'] = event_details.get('start_time', '')
+        event_dict['end_time'] = event_details.get('end_time', '')
+        event_dict['event_name'] = event_name  # Add event_name field for consistency
+        
+        enriched_events.append(event_dict)
     
-    # Fallback to original logic
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return {
+        "total_events": len(enriched_events),
+        "events": enriched_events
+    }
+
+def build_static_payloads(assignments_df, events_df, summary_df, orientation_events: Dict,
+                          leader_directory: Dict[str, Dict]) -> Dict[str, JSONPayload]:
+    """Pre-serialize the responses of endpoints that take no filters"""
+    payloads = {
+        "leaders": JSONPayload(build_leaders_response(assignments_df, leader_directory)),
+        "events": JSONPayload(build_events_response(events_df, orientation_events)),
+        "event_staffing": JSONPayload({
+            "total_events": len(events_df),
+            "events": events_df.to_dict('records')
+        })
+    }
+    if summary_df is not None:
+        payloads["summary"] = JSONPayload({"summary": summary_df.to_dict('records')})
+    return payloads
 
 # Load data at startup
 print("🚀 Starting data loading... (v2)")
-assignments_df, events_df, summary_df, meal_eligibility_df, orientation_events = load_data()
-print(f"📊 Data loaded: assignments={assignments_df is not None}, events={events_df is not None}, meal_eligibility={meal_eligibility_df is not None}")
-if assignments_df is not None:
-    print(f"📈 Assignments shape: {assignments_df.shape}")
-if events_df is not None:
-    print(f"📅 Events shape: {events_df.shape}")
-print(f"🍽️ Orientation events loaded: {len(orientation_events)} events")
+dataset = load_data()
+dataset.version = 1
+print(f"📊 Data loaded: assignments={dataset.assignments_df is not None}, events={dataset.events_df is not None}, meal_eligibility={dataset.meal_eligibility_df is not None}")
+if dataset.assignments_df is not None:
+    print(f"📈 Assignments shape: {dataset.assignments_df.shape}")
+if dataset.events_df is not None:
+    print(f"📅 Events shape: {dataset.events_df.shape}")
+print(f"🍽️ Orientation events loaded: {len(dataset.orientation_events)} events")
+print(f"👥 Leader directory loaded: {len(dataset.leader_directory)} leaders")
+print(f"🗓️ Leader schedules precomputed: {len(dataset.leader_schedules)} leaders")
+
+# Hot reload: poll the source files and swap in a freshly built dataset when they change
+DATA_RELOAD_INTERVAL = float(os.environ.get("DATA_RELOAD_INTERVAL", "10"))
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+# Handlers that filter DataFrames are plain `def`, so FastAPI runs them in its
+# threadpool and the event loop keeps serving cached responses and health checks.
+# pandas holds the GIL for much of that work, so a few threads are enough.
+THREADPOOL_SIZE = int(os.environ.get("THREADPOOL_SIZE", "8"))
+# Set by gunicorn.conf.py: the master watches the files, reloads the data and
+# replaces the workers, so every worker keeps sharing one copy of it
+DATA_RELOAD_IN_MASTER = os.environ.get("DATA_RELOAD_IN_MASTER") == "1"
+_reload_lock = threading.Lock()
+_watcher_stop = threading.Event()
+# Signature of source files that failed to load, not retried until they change again
+_failed_signature = None
+
+def changed_data_signature(current: Optional[OrientationData] = None):
+    """
+    Signature of the source files if they changed since the current dataset
+    was loaded (and they are not the ones that last failed), else None.
+    """
+    if current is None:
+        current = dataset
+    base_dir = current.base_dir or find_data_dir()
+    if base_dir is None:
+        return None
+    signature = data_signature(base_dir)
+    if current.loaded and signature == current.source_signature:
+        return None
+    if signature == _failed_signature:
+        return None
+    return signature
+
+def reload_data(force: bool = False) -> bool:
+    """
+    Rebuild the dataset if its source files changed (or force is set) and
+    swap it in. Returns True if a new dataset was swapped in.
+    
+    The new dataset is fully built before the swap, so requests keep being
+    served from the previous one until then. A failed load keeps the
+    previous dataset, and the same files are not retried unless forced.
+    """
+    global dataset, _failed_signature
+    with _reload_lock:
+        current = dataset
+        base_dir = current.base_dir or find_data_dir()
+        if base_dir is None:
+            return False
+        if not force and changed_data_signature(current) is None:
+            return False
+        
+        print("🔄 Data files changed, reloading...")
+        new_dataset = load_data(base_dir, previous=current)
+        if not new_dataset.loaded:
+            _failed_signature = new_dataset.source_signature
+            print("⚠️ Reload failed, keeping the previous data until the files change again")
+            return False
+        
+        _failed_signature = None
+        new_dataset.version = current.version + 1
+        dataset = new_dataset
+        # Invalidate after the swap so no response built from the old data is cached again
+        response_cache.invalidate()
+        print(f"✅ Data reloaded (version {new_dataset.version})")
+        return True
+
+def _watch_data_files():
+    while not _watcher_stop.wait(DATA_RELOAD_INTERVAL):
+        try:
+            reload_data()
+        except Exception as e:
+            print(f"Error reloading data: {e}")
+
+@app.on_event("startup")
+async def configure_threadpool():
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+@app.on_event("startup")
+async def start_data_watcher():
+    if DATA_RELOAD_INTERVAL > 0 and not DATA_RELOAD_IN_MASTER:
+        _watcher_stop.clear()
+        threading.Thread(target=_watch_data_files, name="data-watcher", daemon=True).start()
+
+@app.on_event("shutdown")
+async def stop_data_watcher():
+    _watcher_stop.set()
+
+def json_response(content) -> Response:
+    """Encode content the way FastAPI would, timing it as the request's serialize stage"""
+    with request_metrics.stage("serialize"):
+        body = dumps(content)
+    return Response(body, media_type="application/json")
+
+# Rows converted and encoded per chunk of an NDJSON stream
+NDJSON_BATCH_ROWS = 2000
+
+def ndjson_rows(df, columns: List[str], batch_size: int = NDJSON_BATCH_ROWS):
+    """
+    Yield the rows of df as newline-delimited JSON objects, one chunk per
+    batch_size rows, so only one batch is ever held as Python objects.
+    """
+    for start in range(0, len(df), batch_size):
+        records = df.iloc[start:start + batch_size][columns].to_dict('records')
+        yield b"".join(dumps(record) + b"\n" for record in records)
 
 @app.get("/")
 async def root():
@@ -130,13 +786,15 @@ async def root():
             "lookup": "/api/lookup/{leader_name}",
             "event_leaders": "/api/event/{event_name}/leaders",
             "leader_details": "/api/leader/{leader_email}",
-            "health": "/health"
+            "health": "/health",
+            "metrics": "/metrics"
         }
     }
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
+    data = dataset
     import glob
     
     # List files in current directory and parent
@@ -160,21 +818,44 @@ async def health_check():
             "parent_files": parent_files
         },
         "data_loaded": {
-            "assignments": assignments_df is not None,
-            "events": events_df is not None,
-            "meal_eligibility": meal_eligibility_df is not None,
-            "orientation_events": len(orientation_events) > 0
+            "assignments": data.assignments_df is not None,
+            "events": data.events_df is not None,
+            "meal_eligibility": data.meal_eligibility_df is not None,
+            "orientation_events": len(data.orientation_events) > 0
         },
         "data_counts": {
-            "assignments": len(assignments_df) if assignments_df is not None else 0,
-            "events": len(events_df) if events_df is not None else 0,
-            "meal_eligibility": len(meal_eligibility_df) if meal_eligibility_df is not None else 0,
-            "orientation_events": len(orientation_events)
-        }
+            "assignments": len(data.assignments_df) if data.assignments_df is not None else 0,
+            "events": len(data.events_df) if data.events_df is not None else 0,
+            "meal_eligibility": len(data.meal_eligibility_df) if data.meal_eligibility_df is not None else 0,
+            "orientation_events": len(data.orientation_events)
+        },
+        "data_version": {
+            "version": data.version,
+            "loaded_at": data.loaded_at
+        },
+        "response_cache": response_cache.stats()
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Request and stage timings in the Prometheus text exposition format"""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled; unset METRICS_ENABLED=0 to enable them")
+    
+    cache_stats = response_cache.stats()
+    extra_lines = (
+        counter_lines("response_cache_hits_total", "Responses served from the response cache",
+                      {"": cache_stats["hits"]})
+        + counter_lines("response_cache_misses_total", "Cacheable responses that had to be computed",
+                        {"": cache_stats["misses"]})
+        + counter_lines("response_cache_entries", "Responses currently held in the response cache",
+                        {"": cache_stats["entries"]}, kind="gauge")
+    )
+    return PlainTextResponse(request_metrics.render(extra_lines), media_type=METRICS_CONTENT_TYPE)
+
 @app.get("/api/event-staffing")
-async def get_event_staffing(
+def get_event_staffing(
+    request: Request,
     fully_staffed: Optional[bool] = Query(None, description="Filter by fully staffed events"),
     time_slot: Optional[str] = Query(None, description="Filter by time slot"),
     min_duration: Optional[float] = Query(None, description="Minimum duration in hours"),
@@ -183,275 +864,195 @@ async def get_event_staffing(
     """
     Get event staffing information with optional filters
     """
-    if events_df is None:
+    data = dataset
+    if data.events_df is None:
         raise HTTPException(status_code=500, detail="Event staffing data not loaded")
     
-    filtered_df = events_df.copy()
-    
-    # Apply filters
-    if fully_staffed is not None:
-        filtered_df = filtered_df[filtered_df['Fully Staffed'] == fully_staffed]
-    
-    if time_slot:
-        filtered_df = filtered_df[filtered_df['Time Slot'].str.contains(time_slot, case=False, na=False)]
+    if fully_staffed is None and not time_slot and min_duration is None and max_duration is None:
+        return data.static_payloads["event_staffing"].response(request.headers.get("accept-encoding"))
     
-    if min_duration is not None:
-        filtered_df = filtered_df[filtered_df['Duration (hours)'] >= min_duration]
+    with request_metrics.stage("filter"):
+        events_df = data.events_df
+        
+        # Apply filters as sorted row sets; None means every row
+        rows = None
+        if min_duration is not None or max_duration is not None:
+            rows = data.duration_index.rows(min_duration, max_duration)
+        
+        if fully_staffed is not None:
+            rows = intersect_rows(rows, mask_rows(events_df['Fully Staffed'] == fully_staffed))
+        
+        if time_slot:
+            # Literal substring, like the other string filters
+            rows = intersect_rows(rows, mask_rows(events_df['Time Slot'].str.contains(time_slot, case=False, regex=False, na=False)))
+        
+        filtered_df = take_rows(events_df, rows)
     
-    if max_duration is not None:
-        filtered_df = filtered_df[filtered_df['Duration (hours)'] <= max_duration]
+    with request_metrics.stage("enrich"):
+        events = filtered_df.to_dict('records')
     
-    return {
+    return json_response({
         "total_events": len(filtered_df),
-        "events": filtered_df.to_dict('records')
-    }
+        "events": events
+    })
 
 @app.get("/api/leader-assignments")
-async def get_leader_assignments(
+def get_leader_assignments(
     leader_email: Optional[str] = Query(None, description="Filter by leader email"),
     event: Optional[str] = Query(None, description="Filter by event name"),
     date: Optional[str] = Query(None, description="Filter by date"),
     min_hours: Optional[float] = Query(None, description="Minimum hours assigned"),
-    max_hours: Optional[float] = Query(None, description="Maximum hours assigned")
+    max_hours: Optional[float] = Query(None, description="Maximum hours assigned"),
+    limit: Optional[int] = Query(None, ge=1, description="Return at most this many assignments"),
+    offset: int = Query(0, ge=0, description="Skip this many matching assignments"),
+    output_format: str = Query("json", alias="format", pattern="^(json|ndjson)$",
+                               description="json, or ndjson to stream one assignment per line")
 ):
     """
-    Get leader assignments with optional filters
+    Get leader assignments with optional filters.
+    
+    With limit or offset, one page is returned along with the offset of the
+    next page. format=ndjson streams the matching assignments as
+    newline-delimited JSON instead, with the match count in X-Total-Count.
     """
-    if assignments_df is None:
+    data = dataset
+    if data.assignments_df is None:
         raise HTTPException(status_code=500, detail="Leader assignments data not loaded")
     
-    filtered_df = assignments_df.copy()
-    
-    # Apply filters
-    if leader_email:
-        filtered_df = filtered_df[filtered_df['Leader Email'].str.contains(leader_email, case=False, na=False)]
+    with request_metrics.stage("filter"):
+        query = data.assignment_query
+        
+        # Each filter is answered from its index; the planner starts from the
+        # one matching the fewest rows and only checks the rest against those
+        predicates = []
+        if leader_email:
+            predicates.append(query.contains('Leader Email', leader_email))
+        
+        if event:
+            predicates.append(query.contains('Event', event))
+        
+        if date:
+            predicates.append(query.equals('Date', date))
+        
+        if min_hours is not None or max_hours is not None:
+            predicates.append(query.between('Hours', min_hours, max_hours))
+        
+        filtered_df = take_rows(data.assignments_df, query.rows(predicates))
     
-    if event:
-        filtered_df = filtered_df[filtered_df['Event'].str.contains(event, case=False, na=False)]
+    total = len(filtered_df)
+    paginated = limit is not None or offset > 0
+    end = total if limit is None else min(offset + limit, total)
+    if paginated:
+        filtered_df = filtered_df.iloc[offset:end]
     
-    if date:
-        filtered_df = filtered_df[filtered_df['Date'] == date]
+    if output_format == "ndjson":
+        return StreamingResponse(
+            ndjson_rows(filtered_df, ASSIGNMENT_COLUMNS),
+            media_type="application/x-ndjson",
+            headers={"X-Total-Count": str(total)}
+        )
     
-    if min_hours is not None:
-        filtered_df = filtered_df[filtered_df['Hours'] >= min_hours]
+    with request_metrics.stage("enrich"):
+        assignments = filtered_df[ASSIGNMENT_COLUMNS].to_dict('records')
     
-    if max_hours is not None:
-        filtered_df = filtered_df[filtered_df['Hours'] <= max_hours]
+    if not paginated:
+        return json_response({
+            "total_assignments": total,
+            "assignments": assignments
+        })
     
-    return {
-        "total_assignments": len(filtered_df),
-        "assignments": filtered_df.to_dict('records')
-    }
+    return json_response({
+        "total_assignments": total,
+        "offset": offset,
+        "limit": limit,
+        "next_offset": end if end < total else None,
+        "assignments": assignments
+    })
 
 @app.get("/api/summary")
-async def get_summary():
+async def get_summary(request: Request):
     """
     Get orientation assignment summary statistics
     """
-    if summary_df is None:
+    data = dataset
+    if data.summary_df is None:
         raise HTTPException(status_code=500, detail="Summary data not loaded")
     
-    return {
-        "summary": summary_df.to_dict('records')
-    }
+    return data.static_payloads["summary"].response(request.headers.get("accept-encoding"))
 
 @app.get("/api/leaders")
-async def get_all_leaders():
+async def get_all_leaders(request: Request):
     """Get a list of all leaders with their assignment statistics"""
-    if assignments_df is None:
+    data = dataset
+    if data.assignments_df is None:
         raise HTTPException(status_code=500, detail="Data not loaded")
     
-    # Get unique leaders and their assignment counts
-    leader_stats = assignments_df.groupby('Leader Email').agg({
-        'Event': 'count',
-        'Hours': 'sum'
-    }).reset_index()
-    
-    leader_stats.columns = ['email', 'event_count', 'total_hours']
-    
-    # Add names if available
-    try:
-        leaders_df = pd.read_csv(os.path.join(get_base_dir(), "Trinity College Orientation Leaders 2025(Simplified).csv"))
-        leader_stats = leader_stats.merge(
-            leaders_df[['Email', 'First Name', 'Last Name']], 
-            left_on='email', 
-            right_on='Email',
-            how='left'
-        )
-        leader_stats['full_name'] = leader_stats['First Name'].fillna('') + ' ' + leader_stats['Last Name'].fillna('')
-        leader_stats['full_name'] = leader_stats['full_name'].str.strip()
-        leader_stats.loc[leader_stats['full_name'] == '', 'full_name'] = leader_stats['email']
-    except Exception as e:
-        print(f"Error loading leader names: {e}")
-        leader_stats['full_name'] = leader_stats['email']
-    
-    # Sort by total hours (descending)
-    leader_stats = leader_stats.sort_values('total_hours', ascending=False)
-    
-    return {
-        "total_leaders": len(leader_stats),
-        "leaders": leader_stats[['full_name', 'email', 'event_count', 'total_hours']].to_dict('records')
-    }
+    return data.static_payloads["leaders"].response(request.headers.get("accept-encoding"))
 
 @app.get("/api/events")
-async def get_all_events():
+async def get_all_events(request: Request):
     """Get a list of all events with staffing information and event type details"""
-    if events_df is None:
+    data = dataset
+    if data.events_df is None:
         raise HTTPException(status_code=500, detail="Event data not loaded")
     
-    # Sort by date and time for better organization
-    events_sorted = events_df.sort_values(['Time Slot', 'Event'])
-    
-    # Enrich events with type information from orientation_schedule.py
-    enriched_events = []
-    for _, event_row in events_sorted.iterrows():
-        event_dict = event_row.to_dict()
-        event_name = event_dict['Event']
-        
-        # Get additional event details from orientation schedule
-        event_details = orientation_events.get(event_name, {})
-        
-        # Add type information
-        event_dict['is_meal'] = event_details.get('is_meal', False)
-        event_dict['is_indoor'] = event_details.get('is_indoor', False)
-        event_dict['is_outdoor'] = event_details.get('is_outdoor', False)
-        event_dict['is_core'] = event_details.get('is_core', False)
-        event_dict['location'] = event_details.get('location', '')
-        event_dict['date'] = event_details.get('date', '')
-        event_dict['start_time'] = event_details.get('start_time', '')
-        event_dict['end_time'] = event_details.get('end_time', '')
-        event_dict['event_name'] = event_name  # Add event_name field for consistency
-        
-        enriched_events.append(event_dict)
-    
-    return {
-        "total_events": len(enriched_events),
-        "events": enriched_events
-    }
+    return data.static_payloads["events"].response(request.headers.get("accept-encoding"))
 
 @app.get("/api/lookup/{leader_name:path}")
-async def lookup_leader_schedule(leader_name: str):
+async def lookup_leader_schedule(
+    leader_name: str,
+    limit: Optional[int] = Query(None, ge=1, le=50, description="Also return up to this many ranked matches")
+):
     """
     Look up a leader's scheduled events by name.
     
     Args:
-        leader_name: The name of the leader (can be first name, last name, or full name)
+        leader_name: The name of the leader (can be first name, last name, full name or email)
+        limit: If set, include a ranked "matches" list for autocomplete
     
     Returns:
-        List of scheduled events with details
+        List of scheduled events with details for the best match
     """
+    data = dataset
     # Validate search input first - require at least 3 characters
     leader_name_cleaned = leader_name.strip()
     if len(leader_name_cleaned) < 3:
         raise HTTPException(status_code=400, detail="Search term must be at least 3 characters long")
     
     try:
-        if assignments_df is None or events_df is None:
+        if data.assignments_df is None or data.events_df is None:
             raise HTTPException(status_code=500, detail="Data not loaded")
         
-        leader_name_lower = leader_name_cleaned.lower()
-        leader_assignments = pd.DataFrame()  # Start with empty
+        # Ranked matches: exact and prefix name hits first, then substrings, then emails
+        with request_metrics.stage("search"):
+            matches = data.search_index.search(leader_name_cleaned, limit=limit or 1)
         
-        # First try name-based search (prioritize this)
-        try:
-            leaders_df = pd.read_csv(os.path.join(get_base_dir(), "Trinity College Orientation Leaders 2025(Simplified).csv"))
-            
-            # Simple but effective name matching
-            name_matches = leaders_df[
-                (leaders_df['First Name'].str.lower().str.contains(leader_name_lower, na=False, regex=False)) |
-                (leaders_df['Last Name'].str.lower().str.contains(leader_name_lower, na=False, regex=False)) |
-                ((leaders_df['First Name'].str.lower() + ' ' + leaders_df['Last Name'].str.lower()).str.contains(leader_name_lower, na=False, regex=False))
-            ]
-            
-            if len(name_matches) > 0:
-                # Get the email and find assignments
-                leader_email = name_matches.iloc[0]['Email']
-                leader_assignments = assignments_df[
-                    assignments_df['Leader Email'] == leader_email
-                ]
-        except Exception as e:
-            print(f"Error in name search: {e}")
-        
-        # If no name matches and search is long enough, try restrictive email search
-        if len(leader_assignments) == 0 and len(leader_name_lower) >= 5:
-            # Only search email if the search term is substantial (5+ chars) to avoid false matches
-            leader_assignments = assignments_df[
-                assignments_df['Leader Email'].str.lower().str.contains(leader_name_lower, na=False, regex=False)
-            ]
-        
-        if len(leader_assignments) == 0:
+        if not matches:
             raise HTTPException(
                 status_code=404, 
                 detail=f"No leader found with name containing '{leader_name}'"
             )
         
-        # Get the leader's email for additional info
-        leader_email = leader_assignments.iloc[0]['Leader Email']
-        
-        # Get leader details from original data
-        try:
-            leaders_df = pd.read_csv(os.path.join(get_base_dir(), "Trinity College Orientation Leaders 2025(Simplified).csv"))
-            leader_info = leaders_df[leaders_df['Email'] == leader_email].iloc[0]
-            leader_full_name = f"{leader_info['First Name']} {leader_info['Last Name']}"
-        except:
-            leader_full_name = leader_email
-        
-        # Build the response with event details
-        events = []
-        for _, assignment in leader_assignments.iterrows():
-            event_name = assignment['Event']
-            date = assignment['Date']
-            start_time = assignment['Start Time']
-            end_time = assignment['End Time']
-            hours = assignment['Hours']
-            
-            # Get location and other details from orientation events
-            event_details = orientation_events.get(event_name, {})
-            location = event_details.get('location', 'Location not specified')
-            
-            events.append({
-                "event_name": event_name,
-                "date": date,
-                "start_time": start_time,
-                "end_time": end_time,
-                "duration_hours": hours,
-                "location": location
-            })
-        
-        # Sort events by date and time
-        events.sort(key=lambda x: (x['date'], x['start_time']))
+        response = data.leader_schedules[matches[0]]["lookup"]
+        if limit is None:
+            return json_response(response)
         
-        # Get meal eligibility for this leader
-        meal_eligibility = []
-        if meal_eligibility_df is not None:
-            eligible_meals = meal_eligibility_df[
-                meal_eligibility_df['Eligible Leader'] == leader_email
-            ]
-            for _, meal_row in eligible_meals.iterrows():
-                # Get meal details from orientation events
-                meal_name = meal_row['Meal Event']
-                meal_details = orientation_events.get(meal_name, {})
-                
-                meal_eligibility.append({
-                    "meal_name": meal_name,
-                    "date": meal_details.get('date', 'Unknown'),
-                    "start_time": meal_details.get('start_time', 'Unknown'),
-                    "end_time": meal_details.get('end_time', 'Unknown'),
-                    "location": meal_details.get('location', 'Unknown'),
-                    "reason": meal_row['Reason']
-                })
-        
-        # Sort meals by date and time
-        meal_eligibility.sort(key=lambda x: (x['date'], x['start_time']))
-        
-        return {
-            "leader_name": leader_full_name,
-            "leader_email": leader_email,
-            "total_events": len(events),
-            "total_hours": sum(event['duration_hours'] for event in events),
-            "events": events,
-            "meal_eligibility": meal_eligibility
-        }
+        with request_metrics.stage("enrich"):
+            response = {
+                **response,
+                "matches": [
+                    {
+                        "leader_name": data.leader_schedules[email]["lookup"]["leader_name"],
+                        "leader_email": email,
+                        "total_events": data.leader_schedules[email]["lookup"]["total_events"],
+                        "total_hours": data.leader_schedules[email]["lookup"]["total_hours"]
+                    }
+                    for email in matches
+                ]
+            }
+        return json_response(response)
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in lookup_leader_schedule for '{leader_name}': {e}")
         import traceback
@@ -472,167 +1073,83 @@ async def get_event_leaders(event_name: str):
     Returns:
         List of leaders assigned to this event with their details
     """
-    if assignments_df is None:
+    data = dataset
+    if data.assignments_df is None:
         raise HTTPException(status_code=500, detail="Data not loaded")
     
-    # Find event assignments (case-insensitive partial match)
-    # First try exact match, then partial match
-    exact_match = assignments_df[assignments_df['Event'] == event_name]
-    if len(exact_match) > 0:
-        event_assignments = exact_match
-    else:
-        # Try case-insensitive exact match
-        exact_match_ci = assignments_df[assignments_df['Event'].str.lower() == event_name.lower()]
-        if len(exact_match_ci) > 0:
-            event_assignments = exact_match_ci
-        else:
-            # Fall back to partial match
-            event_assignments = assignments_df[
-                assignments_df['Event'].str.contains(event_name, case=False, na=False)
-            ]
+    # First try exact match, then case-insensitive match, then partial match
+    with request_metrics.stage("search"):
+        exact_event_name = event_name if event_name in data.event_leaders else None
+        if exact_event_name is None:
+            event_name_folded = event_name.casefold()
+            exact_event_name = data.event_name_index.get(event_name_folded)
+            if exact_event_name is None:
+                # Fall back to a plain substring match over the distinct event names
+                exact_event_name = next(
+                    (name for folded, name in data.event_name_index.items() if event_name_folded in folded),
+                    None
+                )
     
-    if len(event_assignments) == 0:
+    if exact_event_name is None:
         raise HTTPException(
             status_code=404, 
             detail=f"No event found matching '{event_name}'"
         )
     
-    # Get the exact event name from the first match
-    exact_event_name = event_assignments.iloc[0]['Event']
-    
-    # Filter to exact matches only
-    event_assignments = assignments_df[assignments_df['Event'] == exact_event_name]
-    
-    # Get event details from the orientation schedule
-    event_details = orientation_events.get(exact_event_name, {})
-    
-    # Get event staffing info
-    event_staffing = events_df[events_df['Event'] == exact_event_name]
-    if len(event_staffing) > 0:
-        staffing_info = event_staffing.iloc[0].to_dict()
-    else:
-        staffing_info = {}
-    
-    # Build leader list with details
-    leaders = []
-    try:
-        leaders_df = pd.read_csv(os.path.join(get_base_dir(), "Trinity College Orientation Leaders 2025(Simplified).csv"))
-        
-        for _, assignment in event_assignments.iterrows():
-            leader_email = assignment['Leader Email']
-            
-            # Get leader details from original data
-            leader_info = leaders_df[leaders_df['Email'] == leader_email]
-            if len(leader_info) > 0:
-                leader_data = leader_info.iloc[0]
-                leader_name = f"{leader_data['First Name']} {leader_data['Last Name']}"
-                leader_details = {
-                    "name": leader_name,
-                    "email": leader_email,
-                    "first_name": leader_data['First Name'],
-                    "last_name": leader_data['Last Name']
-                }
-            else:
-                leader_details = {
-                    "name": leader_email,
-                    "email": leader_email,
-                    "first_name": "",
-                    "last_name": ""
-                }
-            
-            leaders.append(leader_details)
-    except Exception as e:
-        print(f"Error loading leader details: {e}")
-        # Fallback to just email addresses
-        for _, assignment in event_assignments.iterrows():
-            leaders.append({
-                "name": assignment['Leader Email'],
-                "email": assignment['Leader Email'],
-                "first_name": "",
-                "last_name": ""
-            })
-    
-    # Sort leaders by name
-    leaders.sort(key=lambda x: x['name'])
-    
-    return {
-        "event_name": exact_event_name,
-        "event_details": {
-            "date": event_assignments.iloc[0]['Date'] if len(event_assignments) > 0 else "",
-            "start_time": event_assignments.iloc[0]['Start Time'] if len(event_assignments) > 0 else "",
-            "end_time": event_assignments.iloc[0]['End Time'] if len(event_assignments) > 0 else "",
-            "duration_hours": event_assignments.iloc[0]['Hours'] if len(event_assignments) > 0 else 0,
-            "location": event_details.get('location', 'Location not specified')
-        },
-        "staffing_info": staffing_info,
-        "total_leaders": len(leaders),
-        "leaders": leaders
-    }
+    return json_response(data.event_leaders[exact_event_name])
 
 @app.get("/api/leader/{leader_email}")
 async def get_leader_details(leader_email: str):
     """
     Get detailed information about a specific leader by email
     """
-    if assignments_df is None:
+    data = dataset
+    if data.assignments_df is None:
         raise HTTPException(status_code=500, detail="Data not loaded")
     
-    # Get leader assignments
-    leader_assignments = assignments_df[assignments_df['Leader Email'] == leader_email]
-    
-    if len(leader_assignments) == 0:
+    schedule = data.leader_schedules.get(leader_email)
+    if schedule is None:
         raise HTTPException(status_code=404, detail=f"No leader found with email: {leader_email}")
     
-    # Get leader details
-    try:
-        leaders_df = pd.read_csv(os.path.join(get_base_dir(), "Trinity College Orientation Leaders 2025(Simplified).csv"))
-        leader_info = leaders_df[leaders_df['Email'] == leader_email]
-        if len(leader_info) > 0:
-            leader_details = leader_info.iloc[0].to_dict()
-        else:
-            leader_details = {"Email": leader_email}
-    except:
-        leader_details = {"Email": leader_email}
-    
-    # Calculate statistics
-    total_hours = leader_assignments['Hours'].sum()
-    event_count = len(leader_assignments)
-    
-    # Get event details
-    events = []
-    for _, assignment in leader_assignments.iterrows():
-        event_name = assignment['Event']
-        
-        # Get event staffing info
-        event_staffing = events_df[events_df['Event'] == event_name]
-        if len(event_staffing) > 0:
-            event_info = event_staffing.iloc[0]
-            time_slot = event_info['Time Slot']
-            duration = event_info['Duration (hours)']
-        else:
-            time_slot = assignment['Start Time'] + " - " + assignment['End Time']
-            duration = assignment['Hours']
-        
-        events.append({
-            "event_name": event_name,
-            "date": assignment['Date'],
-            "start_time": assignment['Start Time'],
-            "end_time": assignment['End Time'],
-            "time_slot": time_slot,
-            "duration_hours": duration
-        })
+    return json_response(schedule["details"])
+
+@app.post("/admin/reload")
+async def reload_data_endpoint(
+    force: bool = Query(False, description="Reload even if the data files have not changed"),
+    x_admin_token: Optional[str] = Header(None)
+):
+    """
+    Reload the assignment CSVs without restarting the server.
     
-    # Sort events by date and time
-    events.sort(key=lambda x: (x['date'], x['start_time']))
+    Requires the ADMIN_TOKEN environment variable to be set and sent back in
+    the X-Admin-Token header. The background watcher does the same thing
+    automatically every DATA_RELOAD_INTERVAL seconds.
     
+    Under gunicorn the request is handed to the master, which always does a
+    forced reload and then replaces the workers, this one included.
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Reload endpoint is disabled; set ADMIN_TOKEN to enable it")
+    if x_admin_token != ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    
+    if DATA_RELOAD_IN_MASTER:
+        os.kill(os.getppid(), signal.SIGHUP)
+        data = dataset
+        return {
+            "reloaded": False,
+            "scheduled": True,
+            "version": data.version,
+            "loaded_at": data.loaded_at
+        }
+    
+    # Build the new dataset off the event loop so other requests keep being served
+    reloaded = await run_in_threadpool(reload_data, force)
+    data = dataset
     return {
-        "leader_details": leader_details,
-        "statistics": {
-            "total_events": event_count,
-            "total_hours": total_hours,
-            "average_hours_per_event": total_hours / event_count if event_count > 0 else 0
-        },
-        "assignments": events
+        "reloaded": reloaded,
+        "version": data.version,
+        "loaded_at": data.loaded_at
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+"""
+Pre-serialized JSON payloads for endpoints whose response never varies.
+
+Payloads are encoded once with orjson when the data is loaded and
+precompressed with gzip and brotli, so serving them is just picking the
+right byte string for the client.
+"""
+
+import gzip
+from typing import Dict, Iterable, Optional
+
+import orjson
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # listed in requirements; without it only gzip is offered
+    brotli = None
+
+# Encodings the API can produce, in order of preference
+SUPPORTED_ENCODINGS = ("br", "gzip")
+
+# The subset this process can actually produce
+AVAILABLE_ENCODINGS = tuple(
+    coding for coding in SUPPORTED_ENCODINGS if coding != "br" or brotli is not None
+)
+
+
+def dumps(obj) -> bytes:
+    """
+    Encode obj as compact UTF-8 JSON.
+
+    numpy scalars and arrays are written as plain numbers and lists, and
+    NaN as null.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def preferred_encoding(accept_encoding: Optional[str],
+                       available: Iterable[str] = SUPPORTED_ENCODINGS) -> str:
+    """
+    Pick the best content coding from an Accept-Encoding header.
+
+    Returns one of the available codings, or "identity" if the client
+    accepts none of them.
+    """
+    if not accept_encoding:
+        return "identity"
+
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        quality = params.strip()
+        if quality.startswith("q=") and quality[2:].strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(coding)
+
+    for coding in available:
+        if coding in accepted or "*" in accepted:
+            return coding
+    return "identity"
+
+
+class JSONPayload:
+    """A JSON body encoded once, with precompressed variants."""
+
+    def __init__(self, obj, compress: bool = True):
+        self.body = dumps(obj)
+        self.variants: Dict[str, bytes] = {}
+
+        if compress:
+            gzipped = gzip.compress(self.body, compresslevel=9, mtime=0)
+            if len(gzipped) < len(self.body):
+                self.variants["gzip"] = gzipped
+            if brotli is not None:
+                compressed = brotli.compress(self.body)
+                if len(compressed) < len(self.body):
+                    self.variants["br"] = compressed
+
+    def response(self, accept_encoding: Optional[str] = None) -> Response:
+        """Build a Response using the best variant the client accepts"""
+        available = [coding for coding in SUPPORTED_ENCODINGS if coding in self.variants]
+        encoding = preferred_encoding(accept_encoding, available)
+        if encoding == "identity":
+            return Response(
+                content=self.body,
+                media_type="application/json",
+                headers={"Vary": "Accept-Encoding"}
+            )
+        return Response(
+            content=self.variants[encoding],
+            media_type="application/json",
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+        )
@@ -0,0 +1,221 @@
+"""
+Prebuilt row indexes and a small query planner for the filtered DataFrame
+endpoints.
+
+Filters are answered as sorted arrays of row positions rather than boolean
+masks over a copied frame:
+
+- SortedColumnIndex: numeric columns (hours, durations), presorted so a
+  range is two binary searches.
+- CategoryIndex: categorical columns (emails, events, dates), with the rows
+  of each distinct value (a hash index) and a trigram index over the values
+  for case-insensitive substring filters.
+
+Both can count their matches exactly without touching the rows. QueryPlanner
+uses those counts to start from the most selective filter and checks the
+other filters only against the rows still in the running.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from search_index import trigrams
+
+
+class SortedColumnIndex:
+    """Row positions of a numeric column ordered by value, for range queries."""
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        self._values = values
+        # Stable, so rows with equal values stay in row order; NaNs sort last
+        self._order = np.argsort(values, kind="stable")
+        self._sorted = values[self._order]
+        # NaN never satisfies a comparison, so ranges stop before them
+        self._valid = len(values) - int(np.count_nonzero(np.isnan(values)))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _bounds(self, low: Optional[float], high: Optional[float]):
+        start = 0 if low is None else int(np.searchsorted(self._sorted[:self._valid], low, side="left"))
+        end = self._valid if high is None else int(np.searchsorted(self._sorted[:self._valid], high, side="right"))
+        return start, max(start, end)
+
+    def count(self, low: Optional[float] = None, high: Optional[float] = None) -> int:
+        """Number of rows with low <= value <= high"""
+        if low is None and high is None:
+            return len(self._order)
+        start, end = self._bounds(low, high)
+        return end - start
+
+    def rows(self, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+        """Sorted positions of rows with low <= value <= high (either bound optional)"""
+        if low is None and high is None:
+            return np.arange(len(self._order))
+        start, end = self._bounds(low, high)
+        return np.sort(self._order[start:end])
+
+    def filter(self, rows: np.ndarray, low: Optional[float] = None, high: Optional[float] = None) -> np.ndarray:
+        """The positions in rows whose value is within [low, high]"""
+        values = self._values[rows]
+        keep = np.ones(len(rows), dtype=bool)
+        if low is not None:
+            keep &= values >= low
+        if high is not None:
+            keep &= values <= high
+        return rows[keep]
+
+
+class CategoryIndex:
+    """
+    Rows of a categorical column grouped by value, plus a trigram index over
+    the distinct values for substring search.
+
+    Substring matching mirrors pandas' str.contains(case=False, regex=False):
+    the pattern and each value are compared upper-cased.
+    """
+
+    def __init__(self, column):
+        categories = column.cat.categories
+        codes = column.cat.codes.to_numpy()
+        self._codes = codes
+        self._code_of: Dict[str, int] = {value: code for code, value in enumerate(categories)}
+
+        # Rows sorted by code (stable, so row order within a value); missing values (-1) come first
+        self._order = np.argsort(codes, kind="stable")
+        self._counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        missing = len(codes) - int(self._counts.sum())
+        self._starts = missing + np.concatenate(([0], np.cumsum(self._counts)))
+
+        self._folded: List[str] = [str(value).upper() for value in categories]
+        self._postings: Dict[str, Set[int]] = {}
+        for code, value in enumerate(self._folded):
+            for gram in trigrams(value):
+                self._postings.setdefault(gram, set()).add(code)
+
+    def equal_codes(self, value) -> np.ndarray:
+        """Code of value, as a one-element array, or an empty array if it never occurs"""
+        code = self._code_of.get(value)
+        return np.array([] if code is None else [code], dtype=np.int64)
+
+    def contains_codes(self, pattern: str) -> np.ndarray:
+        """Sorted codes of the values containing pattern, ignoring case"""
+        folded = pattern.upper()
+        grams = trigrams(folded)
+        if grams:
+            # Only values sharing every trigram of the pattern can contain it
+            candidates: Iterable[int] = set.intersection(*(self._postings.get(gram, set()) for gram in grams))
+        else:
+            candidates = range(len(self._folded))
+        return np.array(sorted(code for code in candidates if folded in self._folded[code]), dtype=np.int64)
+
+    def count(self, codes: np.ndarray) -> int:
+        """Number of rows holding any of codes"""
+        return int(self._counts[codes].sum())
+
+    def rows(self, codes: np.ndarray) -> np.ndarray:
+        """Sorted positions of rows holding any of codes"""
+        groups = [self._order[self._starts[code]:self._starts[code + 1]] for code in codes]
+        if not groups:
+            return np.array([], dtype=np.int64)
+        if len(groups) == 1:
+            return groups[0]
+        return np.sort(np.concatenate(groups))
+
+    def filter(self, rows: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """The positions in rows holding any of codes"""
+        # One extra False slot at the end, which missing values (-1) index
+        wanted = np.zeros(len(self._counts) + 1, dtype=bool)
+        wanted[codes] = True
+        return rows[wanted[self._codes[rows]]]
+
+
+class Predicate:
+    """One filter bound to the index that answers it."""
+
+    def __init__(self, description: str, estimate: int, rows, filter_rows):
+        self.description = description
+        # Rows matching this filter alone
+        self.estimate = estimate
+        self.rows = rows
+        self.filter = filter_rows
+
+    def __repr__(self) -> str:
+        return f"<Predicate {self.description} ~{self.estimate} rows>"
+
+
+class QueryPlanner:
+    """
+    Indexes for the filterable columns of one DataFrame, and evaluation of
+    any combination of filters on them, most selective first.
+    """
+
+    def __init__(self, df, category_columns: Iterable[str] = (), range_columns: Iterable[str] = ()):
+        self.num_rows = len(df)
+        self.categories = {column: CategoryIndex(df[column]) for column in category_columns}
+        self.ranges = {column: SortedColumnIndex(df[column]) for column in range_columns}
+
+    def _category_predicate(self, column: str, description: str, codes: np.ndarray) -> Predicate:
+        index = self.categories[column]
+        return Predicate(
+            description, index.count(codes),
+            lambda: index.rows(codes),
+            lambda rows: index.filter(rows, codes)
+        )
+
+    def equals(self, column: str, value) -> Predicate:
+        """Rows where column == value"""
+        codes = self.categories[column].equal_codes(value)
+        return self._category_predicate(column, f"{column} == {value!r}", codes)
+
+    def contains(self, column: str, pattern: str) -> Predicate:
+        """Rows where column contains pattern, ignoring case"""
+        codes = self.categories[column].contains_codes(pattern)
+        return self._category_predicate(column, f"{column} contains {pattern!r}", codes)
+
+    def between(self, column: str, low: Optional[float] = None, high: Optional[float] = None) -> Predicate:
+        """Rows where low <= column <= high (either bound optional)"""
+        index = self.ranges[column]
+        return Predicate(
+            f"{low} <= {column} <= {high}", index.count(low, high),
+            lambda: index.rows(low, high),
+            lambda rows: index.filter(rows, low, high)
+        )
+
+    def plan(self, predicates: Iterable[Predicate]) -> List[Predicate]:
+        """Predicates in evaluation order: fewest matching rows first"""
+        return sorted(predicates, key=lambda predicate: predicate.estimate)
+
+    def rows(self, predicates: Iterable[Predicate]) -> Optional[np.ndarray]:
+        """
+        Sorted positions of the rows matching every predicate, or None
+        (every row) when there are no predicates.
+        """
+        ordered = self.plan(predicates)
+        if not ordered:
+            return None
+        rows = ordered[0].rows()
+        for predicate in ordered[1:]:
+            if len(rows) == 0:
+                break
+            rows = predicate.filter(rows)
+        return rows
+
+
+def mask_rows(mask) -> np.ndarray:
+    """Sorted positions of the True entries of a boolean mask or Series"""
+    return np.flatnonzero(np.asarray(mask))
+
+
+def intersect_rows(rows: Optional[np.ndarray], other: np.ndarray) -> np.ndarray:
+    """Intersection of two sorted row sets; rows=None stands for every row"""
+    if rows is None:
+        return other
+    return np.intersect1d(rows, other, assume_unique=True)
+
+
+def take_rows(df, rows: Optional[np.ndarray]):
+    """The rows of df at the given positions, or df itself for rows=None"""
+    return df if rows is None else df.iloc[rows]
@@ -0,0 +1,206 @@
+"""
+In-process response cache with ETag / If-None-Match support.
+
+The API is read-only between data loads, so a successful JSON response for
+a given path and query string can be replayed byte-for-byte until the data
+changes. Cached responses carry a content-hash ETag; clients that send it
+back in If-None-Match get an empty 304 instead of the body.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from payloads import AVAILABLE_ENCODINGS, preferred_encoding
+
+CACHE_CONTROL = b"no-cache"
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag derived from the response body"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class CachedResponse:
+    """A fully buffered response ready to be replayed"""
+
+    __slots__ = ("status", "headers", "body", "etag")
+
+    def __init__(self, status: int, headers: List[Tuple[bytes, bytes]], body: bytes, etag: str):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+
+
+class ResponseCache:
+    """Bounded LRU cache of responses keyed by path and normalized query."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(path: str, query_string: bytes, encoding: str = "identity") -> Tuple:
+        """Cache key that ignores query parameter order"""
+        params = parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)
+        return (path, tuple(sorted(params)), encoding)
+
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple, entry: CachedResponse, generation: int) -> None:
+        """Store an entry unless the cache was invalidated since it was computed"""
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry, e.g. after the underlying data was reloaded"""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "generation": self.generation
+        }
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware that serves GET requests under path_prefix from a
+    ResponseCache and answers matching If-None-Match requests with 304.
+
+    Only 200 responses with a JSON content type are cached; everything else
+    passes through untouched.
+    """
+
+    def __init__(self, app, cache: ResponseCache, path_prefix: str = "/api/"):
+        self.app = app
+        self.cache = cache
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http" or scope["method"] != "GET"
+                or not scope["path"].startswith(self.path_prefix)):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = None
+        accept_encoding = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+            elif name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+
+        # Responses may be precompressed, so clients are bucketed by the encoding
+        # they would be served, out of those this process can produce
+        key = self.cache.make_key(
+            scope["path"], scope.get("query_string", b""),
+            preferred_encoding(accept_encoding, AVAILABLE_ENCODINGS)
+        )
+        entry = self.cache.get(key)
+        if entry is not None:
+            await self._replay(entry, if_none_match, send)
+            return
+
+        generation = self.cache.generation
+        start_message = None
+        body_parts = []
+        passthrough = False
+
+        async def capture(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                content_type = b""
+                for name, value in message.get("headers", []):
+                    if name == b"content-type":
+                        content_type = value
+                        break
+                if message["status"] != 200 or not content_type.startswith(b"application/json"):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            if message["type"] == "http.response.body":
+                body_parts.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+
+                body = b"".join(body_parts)
+                headers = [
+                    (name, value) for name, value in start_message.get("headers", [])
+                    if name not in (b"content-length", b"etag", b"cache-control", b"vary")
+                ]
+                # Entries are bucketed by Accept-Encoding, so shared caches must be too
+                headers.append((b"vary", b"Accept-Encoding"))
+                entry = CachedResponse(start_message["status"], headers, body, compute_etag(body))
+                self.cache.put(key, entry, generation)
+                await self._replay(entry, if_none_match, send)
+
+        await self.app(scope, receive, capture)
+
+    @staticmethod
+    async def _replay(entry: CachedResponse, if_none_match: Optional[str], send) -> None:
+        validators = [
+            (b"etag", entry.etag.encode("latin-1")),
+            (b"cache-control", CACHE_CONTROL)
+        ]
+
+        if etag_matches(if_none_match, entry.etag):
+            headers = validators + [(b"vary", b"Accept-Encoding")]
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers = entry.headers + validators + [
+            (b"content-length", str(len(entry.body)).encode("latin-1"))
+        ]
+        await send({"type": "http.response.start", "status": entry.status, "headers": headers})
+        await send({"type": "http.response.body", "body": entry.body})
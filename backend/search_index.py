@@ -0,0 +1,130 @@
+"""
+Prebuilt name/email search index for the leader lookup endpoint.
+
+Every leader is indexed by the trigrams of their normalized first name,
+last name, full name and email, so a query only verifies the handful of
+leaders that share all of its trigrams instead of scanning the roster.
+Matches are ranked so that exact and prefix hits beat mid-word substrings.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Rank tiers, best first
+EXACT_FULL_NAME = 0
+EXACT_NAME = 1
+FULL_NAME_PREFIX = 2
+NAME_PREFIX = 3
+NAME_SUBSTRING = 4
+EMAIL_PREFIX = 5
+EMAIL_SUBSTRING = 6
+
+# Email matches are only considered for substantial search terms to avoid
+# false matches on short fragments like "mail" or "uto"
+MIN_EMAIL_QUERY_LENGTH = 5
+
+
+def normalize(text) -> str:
+    """Casefold and collapse whitespace so 'Gourav  Gupta' == 'gourav gupta'"""
+    if not isinstance(text, str):
+        return ""
+    return " ".join(text.casefold().split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class LeaderSearchIndex:
+    """Trigram index over leader names and emails with ranked results."""
+
+    def __init__(self, leaders: Iterable[Tuple[str, str, str]]):
+        """
+        Args:
+            leaders: (email, first_name, last_name) tuples. Their order is
+                used to break ties between equally ranked matches.
+        """
+        self._entries: List[Tuple[str, str, str, str, str]] = []
+        self._postings: Dict[str, Set[int]] = {}
+
+        for email, first_name, last_name in leaders:
+            first = normalize(first_name)
+            last = normalize(last_name)
+            full = f"{first} {last}".strip()
+            entry_id = len(self._entries)
+            self._entries.append((email, first, last, full, normalize(email)))
+
+            for field in (first, last, full, normalize(email)):
+                for gram in trigrams(field):
+                    self._postings.setdefault(gram, set()).add(entry_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        """Entry ids that contain every trigram of the query"""
+        grams = trigrams(query)
+        if not grams:
+            # Too short for trigrams; verify every entry directly
+            return range(len(self._entries))
+
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return ()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    def _rank(self, query: str, entry_id: int) -> Optional[int]:
+        """Rank tier for a candidate, or None if it does not actually match"""
+        _, first, last, full, email = self._entries[entry_id]
+
+        if query == full:
+            return EXACT_FULL_NAME
+        if query == first or query == last:
+            return EXACT_NAME
+        if full.startswith(query):
+            return FULL_NAME_PREFIX
+        if first.startswith(query) or last.startswith(query) or f" {query}" in full:
+            return NAME_PREFIX
+        if query in full:
+            return NAME_SUBSTRING
+
+        if len(query) >= MIN_EMAIL_QUERY_LENGTH:
+            if email.startswith(query):
+                return EMAIL_PREFIX
+            if query in email:
+                return EMAIL_SUBSTRING
+        return None
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Return the emails of leaders matching query, best match first.
+
+        Args:
+            query: Part of a first name, last name, full name or email
+            limit: Maximum number of emails to return (all if None)
+        """
+        query = normalize(query)
+        if not query:
+            return []
+
+        ranked = []
+        for entry_id in self._candidates(query):
+            tier = self._rank(query, entry_id)
+            if tier is not None:
+                ranked.append((tier, entry_id))
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
+        return [self._entries[entry_id][0] for _, entry_id in ranked]
@@ -45,6 +45,7 @@ def test_filtered_endpoints():
     # Test leader assignments with filters
     test_endpoint("/api/leader-assignments?min_hours=5.0", "Leader assignments - min 5 hours")
     test_endpoint("/api/leader-assignments?event=Block Party", "Leader assignments - Block Party event")
+    test_endpoint("/api/leader-assignments?limit=50&offset=50", "Leader assignments - second page of 50")
 
 def main():
     """Run all tests"""
@@ -67,6 +68,7 @@ def main():
     
     # Test specific leader lookup
     test_endpoint("/api/lookup/adrianyh", "Leader lookup by name")
+    test_endpoint("/api/lookup/chen?limit=5", "Leader lookup - ranked autocomplete matches")
     
     print("\n" + "=" * 60)
     print("✨ Test suite completed!")
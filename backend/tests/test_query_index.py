@@ -0,0 +1,176 @@
+"""
+Behavior of the query_index row indexes and planner, checked against the
+plain pandas filters they replace.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from query_index import CategoryIndex, QueryPlanner, SortedColumnIndex, take_rows
+
+EMAILS = ["adrian@trincoll.edu", "ADA@trincoll.edu", "bea.m@trincoll.edu", "SStraße@trincoll.edu", None]
+EVENTS = ["Block Party", "Dinner (Mather)", "Welcome Dinner", "block meeting", None]
+DATES = ["Aug 27", "Aug 28", "Aug 29", None]
+HOURS = [0.5, 1.0, 1.5, 2.0, 2.0, 3.25, np.nan]
+
+
+@pytest.fixture(scope="module")
+def df():
+    rng = np.random.default_rng(7)
+    n = 400
+    frame = pd.DataFrame({
+        "Leader Email": rng.choice(np.array(EMAILS, dtype=object), n),
+        "Event": rng.choice(np.array(EVENTS, dtype=object), n),
+        "Date": rng.choice(np.array(DATES, dtype=object), n),
+        "Hours": rng.choice(HOURS, n),
+    })
+    for column in ("Leader Email", "Event", "Date"):
+        frame[column] = frame[column].astype("category")
+    # A category no row holds
+    frame["Date"] = frame["Date"].cat.add_categories(["Sep 1"])
+    return frame
+
+
+@pytest.fixture(scope="module")
+def planner(df):
+    return QueryPlanner(df, ["Leader Email", "Event", "Date"], ["Hours"])
+
+
+def contains_mask(column, pattern):
+    return column.str.contains(pattern, case=False, regex=False, na=False).to_numpy()
+
+
+def range_mask(column, low, high):
+    mask = np.ones(len(column), dtype=bool)
+    if low is not None:
+        mask &= (column >= low).to_numpy()
+    if high is not None:
+        mask &= (column <= high).to_numpy()
+    return mask
+
+
+BOUNDS = [(None, None), (1.0, None), (None, 2.0), (1.0, 2.0), (2.0, 2.0), (1.1, 1.4), (3.0, 1.0), (-5, 100)]
+PATTERNS = ["adrian", "AD", "a", "@", ".", "(", "dinner (", "ss", "STRASSE", "ß", "xyz", "trincoll.edu"]
+
+
+@pytest.mark.parametrize("low,high", BOUNDS)
+def test_sorted_column_index_matches_pandas(df, low, high):
+    index = SortedColumnIndex(df["Hours"])
+    rows = np.arange(len(df))
+    if low is not None or high is not None:
+        rows = np.flatnonzero(range_mask(df["Hours"], low, high))
+
+    assert np.array_equal(index.rows(low, high), rows)
+    assert index.count(low, high) == len(rows)
+
+    candidates = np.arange(0, len(df), 3)
+    expected = np.intersect1d(candidates, np.flatnonzero(range_mask(df["Hours"], low, high)))
+    assert np.array_equal(index.filter(candidates, low, high), expected)
+
+
+def test_sorted_column_index_excludes_nan_from_ranges(df):
+    index = SortedColumnIndex(df["Hours"])
+    nan_rows = np.flatnonzero(df["Hours"].isna())
+    assert len(nan_rows)
+    assert not np.isin(nan_rows, index.rows(0, None)).any()
+    # No bounds means no filter: every row, NaN included
+    assert np.array_equal(index.rows(), np.arange(len(df)))
+    assert index.count() == len(df)
+
+
+def test_sorted_column_index_empty():
+    index = SortedColumnIndex([])
+    assert len(index) == 0
+    assert len(index.rows(1, 2)) == 0
+    assert index.count(1, 2) == 0
+
+
+@pytest.mark.parametrize("column", ["Leader Email", "Event"])
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_category_contains_matches_pandas(df, column, pattern):
+    index = CategoryIndex(df[column])
+    expected = np.flatnonzero(contains_mask(df[column], pattern))
+    codes = index.contains_codes(pattern)
+
+    assert np.array_equal(index.rows(codes), expected)
+    assert index.count(codes) == len(expected)
+    candidates = np.arange(1, len(df), 2)
+    assert np.array_equal(index.filter(candidates, codes), np.intersect1d(candidates, expected))
+
+
+@pytest.mark.parametrize("value", DATES[:-1] + ["Sep 1", "Aug 99", ""])
+def test_category_equals_matches_pandas(df, value):
+    index = CategoryIndex(df["Date"])
+    expected = np.flatnonzero((df["Date"] == value).to_numpy())
+    codes = index.equal_codes(value)
+
+    assert np.array_equal(index.rows(codes), expected)
+    assert index.count(codes) == len(expected)
+    assert np.array_equal(index.filter(np.arange(len(df)), codes), expected)
+
+
+def test_category_missing_values_never_match(df):
+    index = CategoryIndex(df["Date"])
+    missing = np.flatnonzero(df["Date"].isna())
+    assert len(missing)
+    every_code = np.arange(len(df["Date"].cat.categories))
+    assert len(index.filter(missing, every_code)) == 0
+    assert not np.isin(missing, index.rows(every_code)).any()
+
+
+def test_planner_matches_pandas_for_every_combination(df, planner):
+    emails = [None, "adrian", "a", "nobody"]
+    events = [None, "dinner", "bl"]
+    dates = [None, "Aug 28", "Sep 1"]
+    bounds = [(None, None), (1.0, None), (None, 1.5), (2.0, 2.0)]
+
+    for email, event, date, (low, high) in itertools.product(emails, events, dates, bounds):
+        mask = np.ones(len(df), dtype=bool)
+        predicates = []
+        if email is not None:
+            mask &= contains_mask(df["Leader Email"], email)
+            predicates.append(planner.contains("Leader Email", email))
+        if event is not None:
+            mask &= contains_mask(df["Event"], event)
+            predicates.append(planner.contains("Event", event))
+        if date is not None:
+            mask &= (df["Date"] == date).to_numpy()
+            predicates.append(planner.equals("Date", date))
+        if low is not None or high is not None:
+            mask &= range_mask(df["Hours"], low, high)
+            predicates.append(planner.between("Hours", low, high))
+
+        rows = planner.rows(predicates)
+        if not predicates:
+            assert rows is None
+            continue
+        assert np.array_equal(rows, np.flatnonzero(mask)), (email, event, date, low, high)
+        assert take_rows(df, rows).equals(df[mask])
+
+
+def test_planner_starts_from_most_selective_predicate(planner):
+    broad = planner.between("Hours", 0, None)
+    narrow = planner.equals("Date", "Aug 28")
+    nothing = planner.contains("Event", "no such event")
+
+    assert [p.estimate for p in planner.plan([broad, narrow, nothing])] == sorted(
+        [broad.estimate, narrow.estimate, nothing.estimate])
+    assert planner.plan([broad, narrow, nothing])[0] is nothing
+
+
+def test_planner_empty_intersection_skips_remaining_predicates(planner):
+    calls = []
+    later = planner.between("Hours", 0, None)
+    original_filter = later.filter
+    later.filter = lambda rows: (calls.append(len(rows)), original_filter(rows))[1]
+
+    rows = planner.rows([planner.equals("Date", "Aug 99"), later])
+    assert len(rows) == 0
+    assert calls == []
+
+
+def test_take_rows_without_filters_returns_frame(df):
+    assert take_rows(df, None) is df
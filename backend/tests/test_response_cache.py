@@ -0,0 +1,61 @@
+"""
+ResponseCacheMiddleware must never replay a body in an encoding the client
+did not accept, and must mark cached responses as varying by Accept-Encoding.
+"""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from payloads import JSONPayload, preferred_encoding
+from response_cache import ResponseCache, ResponseCacheMiddleware
+
+# Large and repetitive enough that every compressed variant is kept
+PAYLOAD = JSONPayload({"rows": [{"name": "leader", "hours": 2.5}] * 200})
+
+
+def payload_endpoint(request: Request):
+    return PAYLOAD.response(request.headers.get("accept-encoding"))
+
+
+@pytest.fixture
+def client():
+    app = Starlette(routes=[Route("/api/payload", payload_endpoint)])
+    app.add_middleware(ResponseCacheMiddleware, cache=ResponseCache())
+    return TestClient(app)
+
+
+def accepted(accept_encoding):
+    return {part.split(";")[0].strip() for part in accept_encoding.split(",")} | {"identity"}
+
+
+@pytest.mark.parametrize("first,second", [
+    ("gzip, deflate, br", "br"),
+    ("br", "gzip"),
+    ("gzip", "identity"),
+    ("br;q=0, gzip", "br"),
+])
+def test_replayed_encoding_is_accepted_by_client(client, first, second):
+    for accept_encoding in (first, second, first, second):
+        response = client.get("/api/payload", headers={"Accept-Encoding": accept_encoding})
+        encoding = response.headers.get("content-encoding", "identity")
+        assert encoding in accepted(accept_encoding), (accept_encoding, encoding)
+        assert response.json() == {"rows": [{"name": "leader", "hours": 2.5}] * 200}
+        assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_not_modified_carries_vary(client):
+    etag = client.get("/api/payload", headers={"Accept-Encoding": "gzip"}).headers["etag"]
+    response = client.get("/api/payload", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_preferred_encoding():
+    assert preferred_encoding(None) == "identity"
+    assert preferred_encoding("gzip, br") == "br"
+    assert preferred_encoding("gzip, br", ("gzip",)) == "gzip"
+    assert preferred_encoding("br", ("gzip",)) == "identity"
+    assert preferred_encoding("gzip;q=0, *") == "br"
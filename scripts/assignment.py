@@ -1,10 +1,12 @@
-from typing import List, Dict, Set, Tuple
-from datetime import datetime, timedelta
-from collections import defaultdict
-import heapq
+from typing import List, Dict
+import numpy as np
 import pandas as pd
 import os
 
+from availability import AvailabilityMatrix
+from intervals import IntervalSchedule
+from times import time_to_minutes
+
 def parse_leaders_csv(csv_file: str) -> List[Dict]:
     """
     Parse the simplified leaders CSV and convert availability string to dictionary format.
@@ -146,235 +148,234 @@ def output_assignments_to_csv(result: Dict, output_file: str, backend_dir: str =
         pd.DataFrame(conflict_rows).to_csv(conflict_file, index=False)
         print(f"Time conflicts saved to: {conflict_file}")
 
-def schedule_event_leaders(leaders: List[Dict], events: Dict[str, Dict]) -> Dict:
+# Hour cap per leader over the whole orientation
+MAX_LEADER_HOURS = 50
+
+def minutes_to_time(minutes: int) -> str:
+    """Format minutes since midnight like '1:45pm'"""
+    hour, minute = divmod(int(minutes), 60)
+    suffix = "am" if hour < 12 else "pm"
+    return f"{hour % 12 or 12}:{minute:02d}{suffix}"
+
+def duration_hours(start_minutes: int, end_minutes: int) -> float:
+    """Duration in hours between two times given in minutes"""
+    return (end_minutes - start_minutes) * 60 / 3600
+
+class SchedulingProblem:
     """
-    Returns optimal leader assignment with time slot validation.
+    Leaders and events parsed into arrays shared by the scheduling engines.
+    
+    Leaders are indexed by unique email in roster order and events in
+    dictionary order. eligible_by_event[e, l] is True when leader l's
+    availability bitmap covers every slot of the event; it is stored events
+    by leaders so the leaders eligible for one event are a contiguous row,
+    and eligible is the leaders-by-events view of the same memory.
+    overlaps[e] marks every event on the same date whose time overlaps
+    event e (including e itself).
+    
+    max_hours is the per-leader hour cap. An AvailabilityMatrix already
+    built for the same leaders can be passed in to skip rebuilding it; it
+    is only used if it covers every event date.
     """
     
-    # Helper function to parse time
-    def parse_time(time_str: str) -> datetime:
-        """Convert time string to datetime object for comparison"""
-        return datetime.strptime(time_str, "%I:%M%p")
-    
-    # Helper function to calculate hours between times
-    def calculate_hours(start_time: str, end_time: str) -> float:
-        """Calculate duration in hours between two times"""
-        start = parse_time(start_time)
-        end = parse_time(end_time)
-        delta = end - start
-        return delta.total_seconds() / 3600
-    
-    # Helper function to check if event time fits in availability slot
-    def is_time_compatible(availability: str, start_time: str, end_time: str) -> bool:
-        """Check if event time fits within leader's availability"""
-        start = parse_time(start_time)
-        end = parse_time(end_time)
+    def __init__(self, leaders: List[Dict], events: Dict[str, Dict], max_hours: float = MAX_LEADER_HOURS,
+                 availability: AvailabilityMatrix = None):
+        self.max_hours = max_hours
+        # Unique leaders in roster order; a repeated email is eligible wherever any of its rows is
+        self.emails = list(dict.fromkeys(leader["email"] for leader in leaders))
+        self.leader_index = {email: i for i, email in enumerate(self.emails)}
+        self.event_names = list(events)
+        self.needed = [events[name]["leaders_needed"] for name in self.event_names]
         
-        if availability == "unavailable":
-            return False
-        elif availability == "all-day":
-            # All-day means available for any reasonable time during the day
-            # Allow events from 8am to 11pm for all-day availability
-            day_start = parse_time("8:00am")
-            day_end = parse_time("11:00pm")
-            return start >= day_start and end <= day_end
-        elif availability.lower() == "morning":
-            # Morning: 8am-12pm (extended from 9am to catch early events)
-            slot_start = parse_time("8:00am")
-            slot_end = parse_time("12:00pm")
-            return start >= slot_start and end <= slot_end
-        elif availability.lower() == "afternoon":
-            # Afternoon/Evening: 12pm-11pm (as per leader form - afternoon means afternoon/evening)
-            slot_start = parse_time("12:00pm")
-            slot_end = parse_time("11:00pm")
-            return start >= slot_start and end <= slot_end
-        elif availability.lower() == "evening":
-            # Evening: 5pm-11pm (extended to cover late evening events)
-            slot_start = parse_time("5:00pm")
-            slot_end = parse_time("11:00pm")
-            return start >= slot_start and end <= slot_end
+        # Parse every event time once
+        self.dates = list(dict.fromkeys(events[name]["date"] for name in self.event_names))
+        date_index = {date: i for i, date in enumerate(self.dates)}
+        self.event_date = np.array([date_index[events[name]["date"]] for name in self.event_names], dtype=np.int64)
+        self.event_start = np.array([time_to_minutes(events[name]["start_time"]) for name in self.event_names], dtype=np.int64)
+        self.event_end = np.array([time_to_minutes(events[name]["end_time"]) for name in self.event_names], dtype=np.int64)
+        self.durations = [duration_hours(start, end) for start, end in zip(self.event_start.tolist(), self.event_end.tolist())]
+        self.event_duration = np.array(self.durations, dtype=np.float64)
         
-        return False
-    
-    # Helper function to check for time conflicts
-    def has_time_conflict(event1_start: str, event1_end: str, 
-                          event2_start: str, event2_end: str) -> bool:
-        """Check if two events have overlapping times"""
-        start1 = parse_time(event1_start)
-        end1 = parse_time(event1_end)
-        start2 = parse_time(event2_start)
-        end2 = parse_time(event2_end)
+        # Every leader against every event in one bitwise pass over the slot bitmap
+        if (availability is None or availability.emails != self.emails
+                or not set(self.dates) <= availability.date_index.keys()):
+            availability = AvailabilityMatrix(leaders, self.dates)
+        self.availability = availability
+        event_masks = availability.masks(
+            [availability.date_index[events[name]["date"]] for name in self.event_names],
+            self.event_start, self.event_end
+        )
+        self.eligible_by_event = np.ascontiguousarray(
+            availability.covers(event_masks).T & (self.event_duration <= max_hours)[:, None]
+        )
+        self.eligible = self.eligible_by_event.T
         
-        # Events overlap if one starts before the other ends
-        return not (end1 <= start2 or end2 <= start1)
-    
-    # Initialize result structure
-    leader_assignments = {leader["email"]: [] for leader in leaders}
-    leader_hours = {leader["email"]: 0 for leader in leaders}
+        self.overlaps = ((self.event_date[:, None] == self.event_date[None, :])
+                         & ~((self.event_end[:, None] <= self.event_start[None, :])
+                             | (self.event_end[None, :] <= self.event_start[:, None])))
+
+def new_event_staffing(events: Dict[str, Dict], problem: SchedulingProblem) -> Dict[str, Dict]:
+    """Empty staffing entry for every event"""
     event_staffing = {}
-    time_conflicts = []
-    
-    # Create event staffing structure
-    for event_name, event_data in events.items():
-        duration = calculate_hours(event_data["start_time"], event_data["end_time"])
+    for j, event_name in enumerate(problem.event_names):
+        event_data = events[event_name]
         event_staffing[event_name] = {
             "assigned_leaders": [],
             "leaders_needed": event_data["leaders_needed"],
             "leaders_assigned": 0,
             "fully_staffed": False,
             "time_slot": f"{event_data['start_time']} - {event_data['end_time']}",
-            "duration_hours": duration
+            "duration_hours": problem.durations[j]
         }
+    return event_staffing
+
+def assignment_record(events: Dict[str, Dict], event_name: str, hours: float) -> Dict:
+    """One entry of a leader's assignment list"""
+    event_data = events[event_name]
+    return {
+        "event": event_name,
+        "date": event_data["date"],
+        "start_time": event_data["start_time"],
+        "end_time": event_data["end_time"],
+        "hours": hours
+    }
+
+class ScheduleState:
+    """
+    A schedule being built: per-leader assignments and hours, per-event
+    staffing, and the candidate rows of leaders that could still take each
+    event without a conflict.
     
-    # Sort events by priority (shorter events first, then by start time)
-    sorted_events = sorted(events.items(), 
-                          key=lambda x: (parse_time(x[1]["start_time"]), 
-                                       calculate_hours(x[1]["start_time"], x[1]["end_time"])))
-    
-    # Track leader-event assignments for conflict detection
-    leader_event_map = defaultdict(list)
-    
-    # First pass: Determine leader availability for each event
-    event_availability = {}
-    for event_name, event_data in events.items():
-        date = event_data["date"]
-        start_time = event_data["start_time"]
-        end_time = event_data["end_time"]
-        duration = calculate_hours(start_time, end_time)
-        
-        available_for_event = []
-        for leader in leaders:
-            email = leader["email"]
-            
-            if date not in leader["availability"]:
-                continue
-            
-            availability = leader["availability"][date]
-            if is_time_compatible(availability, start_time, end_time):
-                # Check if within hour limits
-                if leader_hours[email] + duration <= 50:
-                    available_for_event.append(email)
+    An event's candidate row is its eligibility row until an assignment
+    clears a bit in it; only then is the row copied, so events no leader
+    has been assigned around never copy the eligibility matrix.
+    """
+    
+    def __init__(self, problem: SchedulingProblem, events: Dict[str, Dict]):
+        self.problem = problem
+        self.events = events
+        self.leader_assignments = {email: [] for email in problem.emails}
+        self.hours = np.zeros(len(problem.emails), dtype=np.float64)
+        self.event_staffing = new_event_staffing(events, problem)
+        # Candidate rows that differ from eligibility, by event
+        self.candidates: Dict[int, np.ndarray] = {}
+        self.assigned_counts = [0] * len(problem.event_names)
+    
+    def can_assign(self, leader: int, event: int) -> bool:
+        """Available, not already assigned, no conflicting shift, and under the hour cap"""
+        return bool(self.candidate_row(event)[leader]
+                    and self.hours[leader] + self.problem.durations[event] <= self.problem.max_hours)
+    
+    def candidate_row(self, event: int) -> np.ndarray:
+        """Leaders that could still take the event without a conflict; read-only"""
+        row = self.candidates.get(event)
+        return self.problem.eligible_by_event[event] if row is None else row
+    
+    def clear_candidate(self, leader: int, event: int) -> None:
+        row = self.candidates.get(event)
+        if row is None:
+            row = self.candidates[event] = self.problem.eligible_by_event[event].copy()
+        row[leader] = False
+    
+    def assign(self, leader: int, event: int) -> None:
+        problem = self.problem
+        email = problem.emails[leader]
+        event_name = problem.event_names[event]
         
-        event_availability[event_name] = {
-            "available_leaders": available_for_event,
-            "leaders_needed": event_data["leaders_needed"],
-            "date": date,
-            "start_time": start_time,
-            "end_time": end_time,
-            "duration": duration
+        self.leader_assignments[email].append(assignment_record(self.events, event_name, problem.durations[event]))
+        self.hours[leader] += problem.durations[event]
+        for other in np.flatnonzero(problem.overlaps[event]).tolist():
+            self.clear_candidate(leader, other)
+        self.clear_candidate(leader, event)
+        self.event_staffing[event_name]["assigned_leaders"].append(email)
+        self.event_staffing[event_name]["leaders_assigned"] += 1
+        self.assigned_counts[event] += 1
+    
+    def leader_hours(self) -> Dict[str, float]:
+        return {
+            email: float(self.hours[i]) if self.leader_assignments[email] else 0
+            for i, email in enumerate(self.problem.emails)
         }
-    
+
+def staffing_targets(problem: SchedulingProblem) -> List[int]:
+    """How many leaders the greedy engine aims to give each event"""
     # Calculate staffing ratios and implement proportional distribution
-    total_demand = sum(e["leaders_needed"] for e in event_availability.values())
+    available_counts = problem.eligible_by_event.sum(axis=1)
+    needed = problem.needed
+    total_demand = sum(needed)
+    total_supply = int(available_counts.sum())
     
-    # Count total available leader-hours (considering conflicts)
-    total_supply = 0
-    for event_info in event_availability.values():
-        total_supply += len(event_info["available_leaders"])
-    
-    # If there's a shortage, distribute proportionally
     if total_supply < total_demand:
-        # Calculate fair share for each event
+        # If there's a shortage, distribute proportionally
         shortage_ratio = total_supply / total_demand if total_demand > 0 else 0
-        
-        for event_name in event_availability:
-            needed = event_availability[event_name]["leaders_needed"]
-            # Ensure at least 1 leader for each event if possible
-            fair_share = max(1, int(needed * shortage_ratio))
-            event_availability[event_name]["adjusted_target"] = min(
-                fair_share, 
-                len(event_availability[event_name]["available_leaders"])
-            )
-    else:
-        # No shortage, try to fully staff everything
-        for event_name in event_availability:
-            event_availability[event_name]["adjusted_target"] = \
-                event_availability[event_name]["leaders_needed"]
-    
-    # Assignment algorithm with round-robin approach for fairness
-    # Sort events by priority (criticality could be added as a parameter)
-    sorted_events = sorted(event_availability.items(), 
-                          key=lambda x: (parse_time(x[1]["start_time"]), x[1]["duration"]))
+        # Ensure at least 1 leader for each event if possible
+        return [min(max(1, int(need * shortage_ratio)), int(count))
+                for need, count in zip(needed, available_counts)]
+    # No shortage, try to fully staff everything
+    return list(needed)
+
+def fill_round_robin(state: ScheduleState, targets: List[int]) -> None:
+    """Add leaders to events below their target, one per event per round"""
+    problem = state.problem
+    durations = problem.durations
     
-    # Track assignments to prevent conflicts
-    leader_schedule = defaultdict(list)
+    # Sort events by priority (start time, then shorter events first)
+    sorted_events = sorted(range(len(problem.event_names)), key=lambda j: (problem.event_start[j], durations[j]))
     
     # Round-robin assignment to ensure fair distribution
-    assignment_rounds = []
-    max_rounds = max((e["adjusted_target"] for e in event_availability.values()), default=0)
-    
+    max_rounds = max(targets, default=0)
     for round_num in range(max_rounds):
-        round_assignments = []
+        round_assignments = 0
         
-        for event_name, event_info in sorted_events:
+        for j in sorted_events:
             # Skip if event already has enough leaders for this round
-            current_assigned = len(event_staffing[event_name]["assigned_leaders"])
-            target = event_info.get("adjusted_target", event_info["leaders_needed"])
-            
-            if current_assigned >= target:
+            if state.assigned_counts[j] >= targets[j]:
                 continue
             
-            # Find best available leader for this event
-            best_leader = None
-            best_score = float('inf')
-            
-            for leader_email in event_info["available_leaders"]:
-                # Skip if already assigned to this event
-                if leader_email in event_staffing[event_name]["assigned_leaders"]:
-                    continue
-                
-                # Check for conflicts
-                has_conflict = False
-                for scheduled in leader_schedule[leader_email]:
-                    if scheduled["date"] == event_info["date"]:
-                        if has_time_conflict(event_info["start_time"], event_info["end_time"],
-                                           scheduled["start_time"], scheduled["end_time"]):
-                            has_conflict = True
-                            break
-                
-                if has_conflict:
-                    continue
-                
-                # Check hour limit
-                if leader_hours[leader_email] + event_info["duration"] > 50:
-                    continue
-                
-                # Score based on current hours (prefer less loaded leaders)
-                score = leader_hours[leader_email]
-                
-                if score < best_score:
-                    best_score = score
-                    best_leader = leader_email
+            # Available, not already assigned, no conflicting shift, and under the hour cap
+            mask = state.candidate_row(j) & (state.hours + durations[j] <= problem.max_hours)
+            pool = np.flatnonzero(mask)
+            if len(pool) == 0:
+                continue
             
-            # Assign the best leader if found
-            if best_leader:
-                assignment = {
-                    "event": event_name,
-                    "date": event_info["date"],
-                    "start_time": event_info["start_time"],
-                    "end_time": event_info["end_time"],
-                    "hours": event_info["duration"]
-                }
-                
-                leader_assignments[best_leader].append(assignment)
-                leader_hours[best_leader] += event_info["duration"]
-                event_staffing[event_name]["assigned_leaders"].append(best_leader)
-                event_staffing[event_name]["leaders_assigned"] += 1
-                leader_schedule[best_leader].append({
-                    "date": event_info["date"],
-                    "start_time": event_info["start_time"],
-                    "end_time": event_info["end_time"]
-                })
-                
-                round_assignments.append((event_name, best_leader))
+            # Prefer the least loaded leader; ties go to roster order
+            best = int(pool[np.argmin(state.hours[pool])])
+            state.assign(best, j)
+            round_assignments += 1
         
-        if round_assignments:
-            assignment_rounds.append(round_assignments)
-        else:
+        if not round_assignments:
             break  # No more assignments possible
+
+def schedule_event_leaders(leaders: List[Dict], events: Dict[str, Dict], max_hours: float = MAX_LEADER_HOURS,
+                           availability: AvailabilityMatrix = None) -> Dict:
+    """
+    Returns optimal leader assignment with time slot validation.
+    
+    Times are parsed once into integer minutes. Eligibility of every leader
+    for every event is computed as one boolean matrix, which is then used
+    as the candidate set: assigning a leader clears their bits for every
+    event that overlaps the new one, in per-event rows copied on first
+    change. Each pick is a masked argmin over
+    leader hours.
+    """
+    problem = SchedulingProblem(leaders, events, max_hours, availability)
+    state = ScheduleState(problem, events)
+    fill_round_robin(state, staffing_targets(problem))
+    return summarize_schedule(leaders, events, state.leader_assignments, state.leader_hours(), state.event_staffing,
+                              max_hours)
+
+def summarize_schedule(leaders: List[Dict], events: Dict[str, Dict], leader_assignments: Dict[str, List[Dict]],
+                       leader_hours: Dict[str, float], event_staffing: Dict[str, Dict],
+                       max_hours: float = MAX_LEADER_HOURS) -> Dict:
+    """
+    Finalize staffing status, detect time conflicts and build the result
+    dictionary shared by every scheduling engine. max_hours is the hour cap
+    the schedule was built with, for the labor compliance figures.
+    """
+    time_conflicts = []
     
     # Update staffing status
-    for event_name, event_data in events.items():
+    for event_name in events:
         assigned = event_staffing[event_name]["leaders_assigned"]
         needed = event_staffing[event_name]["leaders_needed"]
         event_staffing[event_name]["fully_staffed"] = (assigned >= needed)
@@ -384,27 +385,22 @@ def schedule_event_leaders(leaders: List[Dict], events: Dict[str, Dict]) -> Dict
     
     # Detect time conflicts (double-check)
     for leader_email, assignments in leader_assignments.items():
-        for i, assign1 in enumerate(assignments):
-            for assign2 in assignments[i+1:]:
-                if assign1["date"] == assign2["date"]:
-                    if has_time_conflict(assign1["start_time"], assign1["end_time"],
-                                       assign2["start_time"], assign2["end_time"]):
-                        
-                        # Calculate overlap
-                        start1 = parse_time(assign1["start_time"])
-                        end1 = parse_time(assign1["end_time"])
-                        start2 = parse_time(assign2["start_time"])
-                        end2 = parse_time(assign2["end_time"])
-                        
-                        overlap_start = max(start1, start2)
-                        overlap_end = min(end1, end2)
-                        
-                        conflict = {
-                            "leader": leader_email,
-                            "conflicting_events": [assign1["event"], assign2["event"]],
-                            "overlap_time": f"{overlap_start.strftime('%I:%M%p').lstrip('0').lower()} - {overlap_end.strftime('%I:%M%p').lstrip('0').lower()}"
-                        }
-                        time_conflicts.append(conflict)
+        if len(assignments) < 2:
+            continue
+        schedule = IntervalSchedule()
+        for i, assignment in enumerate(assignments):
+            schedule.add(assignment["date"], time_to_minutes(assignment["start_time"]),
+                         time_to_minutes(assignment["end_time"]), i)
+        
+        # Report each pair in assignment order
+        for first, second, overlap_start, overlap_end in sorted(
+                (min(i, j), max(i, j), start, end) for i, j, start, end in schedule.conflicts()):
+            conflict = {
+                "leader": leader_email,
+                "conflicting_events": [assignments[first]["event"], assignments[second]["event"]],
+                "overlap_time": f"{minutes_to_time(overlap_start)} - {minutes_to_time(overlap_end)}"
+            }
+            time_conflicts.append(conflict)
     
     # Calculate summary statistics
     fully_staffed = [name for name, info in event_staffing.items() if info["fully_staffed"]]
@@ -412,11 +408,13 @@ def schedule_event_leaders(leaders: List[Dict], events: Dict[str, Dict]) -> Dict
     unassigned = [leader["email"] for leader in leaders if not leader_assignments[leader["email"]]]
     
     total_hours = sum(leader_hours.values())
+    leaders_over_cap = [email for email, hours in leader_hours.items() if hours > max_hours]
+    # Kept with its original meaning for existing readers of the summary
     leaders_over_50 = [email for email, hours in leader_hours.items() if hours > 50]
     
     active_leaders = [email for email, hours in leader_hours.items() if hours > 0]
     avg_hours = total_hours / len(active_leaders) if active_leaders else 0
-    max_hours = max(leader_hours.values()) if leader_hours else 0
+    most_hours = max(leader_hours.values()) if leader_hours else 0
     
     # Calculate staffing distribution metrics
     staffing_percentages = [info.get("staffing_percentage", 0) for info in event_staffing.values()]
@@ -446,8 +444,10 @@ def schedule_event_leaders(leaders: List[Dict], events: Dict[str, Dict]) -> Dict
             },
             "labor_compliance": {
                 "leaders_over_50hrs": leaders_over_50,
+                "hour_cap": max_hours,
+                "leaders_over_hour_cap": leaders_over_cap,
                 "avg_hours_per_leader": round(avg_hours, 1),
-                "max_hours_assigned": round(max_hours, 1)
+                "max_hours_assigned": round(most_hours, 1)
             }
         },
         "time_conflicts": time_conflicts
@@ -458,6 +458,16 @@ def schedule_event_leaders(leaders: List[Dict], events: Dict[str, Dict]) -> Dict
 
 # Test with the provided example
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Assign orientation leaders to events")
+    parser.add_argument("--engine", choices=["greedy", "optimal", "incremental"], default="greedy",
+                        help="greedy round-robin (default), integer-programming optimum (needs scipy), "
+                             "or incremental repair of the existing backend assignments")
+    parser.add_argument("--time-limit", type=float, default=10.0,
+                        help="seconds the optimal engine may spend solving (default: 10)")
+    args = parser.parse_args()
+    
     print("Trinity College Orientation Leaders Assignment Algorithm")
     print("=" * 60)
     
@@ -474,12 +484,33 @@ if __name__ == "__main__":
         print(f"Loaded {len(ORIENTATION_EVENTS)} orientation events")
         
         # Run the assignment algorithm
-        print("\nRunning assignment algorithm...")
-        result = schedule_event_leaders(leaders, ORIENTATION_EVENTS)
+        print(f"\nRunning {args.engine} assignment algorithm...")
+        backend_dir = "backend"
+        if args.engine == "incremental":
+            from incremental_assignment import ASSIGNMENTS_FILE, load_assignments_csv, repair_assignments
+            try:
+                existing = load_assignments_csv(os.path.join(backend_dir, ASSIGNMENTS_FILE))
+            except FileNotFoundError as e:
+                parser.error(str(e))
+            result = repair_assignments(leaders, ORIENTATION_EVENTS, existing)
+            
+            changes = result["reassignment"]
+            print(f"Kept {changes['kept']} assignments, removed {len(changes['removed'])}, added {len(changes['added'])}")
+            for change in changes["removed"]:
+                print(f"  - {change['email']}: {change['event']} ({change['reason']})")
+            for change in changes["added"]:
+                print(f"  + {change['email']}: {change['event']}")
+        elif args.engine == "optimal":
+            from optimal_assignment import schedule_event_leaders_optimal
+            try:
+                result = schedule_event_leaders_optimal(leaders, ORIENTATION_EVENTS, time_limit=args.time_limit)
+            except ImportError as e:
+                parser.error(str(e))
+        else:
+            result = schedule_event_leaders(leaders, ORIENTATION_EVENTS)
         
         # Output results to CSV files
         output_prefix = "orientation_assignments"
-        backend_dir = "backend"
         output_assignments_to_csv(result, output_prefix, backend_dir)
         
         # Generate meal eligibility if backend directory exists
@@ -499,6 +530,14 @@ if __name__ == "__main__":
                 print("✅ Meal eligibility generated successfully!")
             except Exception as e:
                 print(f"Warning: Could not generate meal eligibility: {e}")
+            
+            # Bundle the outputs into the binary snapshot the API loads at startup
+            try:
+                from data_snapshot import write_snapshot
+                snapshot_file = write_snapshot(backend_dir)
+                print(f"Data snapshot saved to: {snapshot_file}")
+            except Exception as e:
+                print(f"Warning: Could not write data snapshot: {e}")
         
         # Print summary
         print("\n" + "="*60)
@@ -0,0 +1,135 @@
+"""
+Leader availability as a bitmap of 15-minute slots.
+
+Each leader gets one row of bits spanning every orientation date, one bit per
+slot, packed eight slots to a byte. A time range becomes a mask over the same
+slots, so checking whether a leader is free for it is a bitwise AND, and
+checking every leader against every event is one vectorized operation.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAY_BYTES = SLOTS_PER_DAY // 8
+
+# Upper bound on the temporary built per block of leaders in covers()
+COVERS_BLOCK_BYTES = 32 * 1024 * 1024
+
+# Availability windows in minutes since midnight
+AVAILABILITY_WINDOWS = {
+    # All-day means available for any reasonable time during the day (8am-11pm)
+    "all-day": (8 * 60, 23 * 60),
+    # Morning: 8am-12pm (extended from 9am to catch early events)
+    "morning": (8 * 60, 12 * 60),
+    # Afternoon/Evening: 12pm-11pm (as per leader form - afternoon means afternoon/evening)
+    "afternoon": (12 * 60, 23 * 60),
+    # Evening: 5pm-11pm (extended to cover late evening events)
+    "evening": (17 * 60, 23 * 60),
+}
+
+
+def availability_window(availability: str,
+                        windows: Dict[str, Tuple[int, int]] = AVAILABILITY_WINDOWS) -> Optional[Tuple[int, int]]:
+    """Window (start, end) in minutes for an availability string, or None"""
+    if availability == "all-day":
+        return windows["all-day"]
+    # Partial-day slots are case-insensitive; all-day must match exactly
+    slot = availability.lower()
+    if slot == "all-day":
+        return None
+    return windows.get(slot)
+
+
+def slot_range(start_minutes, end_minutes):
+    """
+    First and one-past-last slot covering [start, end), rounded outwards.
+    A zero-length range still occupies the slot it starts in.
+    """
+    first = np.floor_divide(start_minutes, SLOT_MINUTES)
+    last = -np.floor_divide(-np.asarray(end_minutes), SLOT_MINUTES)
+    return first, np.maximum(last, first + 1)
+
+
+def window_slots(start_minutes: int, end_minutes: int) -> Tuple[int, int]:
+    """
+    First and one-past-last slot lying entirely within [start, end), rounded
+    inwards, so a window off the slot grid never grants time outside it.
+    """
+    first = -(-start_minutes // SLOT_MINUTES)
+    last = end_minutes // SLOT_MINUTES
+    return first, max(first, last)
+
+
+class AvailabilityMatrix:
+    """
+    Packed availability bits for a list of leaders over a list of dates.
+
+    Rows follow unique emails in roster order; a repeated email is available
+    whenever any of its rows is. Dates that are not in `dates` are ignored.
+    `windows` overrides AVAILABILITY_WINDOWS.
+    """
+
+    def __init__(self, leaders: List[Dict], dates: Iterable[str],
+                 windows: Optional[Dict[str, Tuple[int, int]]] = None):
+        windows = AVAILABILITY_WINDOWS if windows is None else windows
+        self.dates = list(dict.fromkeys(dates))
+        self.date_index = {date: i for i, date in enumerate(self.dates)}
+        self.emails = list(dict.fromkeys(leader["email"] for leader in leaders))
+        self.leader_index = {email: i for i, email in enumerate(self.emails)}
+
+        slots = np.zeros((len(self.emails), len(self.dates) * SLOTS_PER_DAY), dtype=bool)
+        for leader in leaders:
+            row = slots[self.leader_index[leader["email"]]]
+            for date, availability in leader["availability"].items():
+                window = availability_window(availability, windows)
+                if window is None or date not in self.date_index:
+                    continue
+                first, last = window_slots(*window)
+                offset = self.date_index[date] * SLOTS_PER_DAY
+                row[offset + first:offset + last] = True
+
+        self.bits = np.packbits(slots, axis=1)
+
+    def masks(self, date_indexes, start_minutes, end_minutes) -> np.ndarray:
+        """Packed slot masks, one row per (date index, start, end) range"""
+        date_indexes = np.asarray(date_indexes, dtype=np.int64)
+        first, last = slot_range(np.asarray(start_minutes, dtype=np.int64),
+                                 np.asarray(end_minutes, dtype=np.int64))
+        first = first + date_indexes * SLOTS_PER_DAY
+        last = last + date_indexes * SLOTS_PER_DAY
+
+        columns = np.arange(len(self.dates) * SLOTS_PER_DAY)
+        slots = (columns >= first[:, None]) & (columns < last[:, None])
+        return np.packbits(slots, axis=1)
+
+    def covers(self, masks: np.ndarray) -> np.ndarray:
+        """Boolean (leaders, ranges) matrix: True where every slot of the range is free"""
+        result = np.zeros((len(self.emails), len(masks)), dtype=bool)
+        if not len(self.emails) or not len(masks):
+            return result
+
+        # A range within one day only touches that day's bytes, so compare day by day,
+        # a block of leaders at a time to bound the (leaders, ranges, bytes) temporary
+        used = masks != 0
+        first_day = np.where(used.any(axis=1), used.argmax(axis=1), 0) // DAY_BYTES
+        last_day = (masks.shape[1] - 1 - used[:, ::-1].argmax(axis=1)) // DAY_BYTES
+        for day in np.unique(first_day):
+            ranges = np.flatnonzero((first_day == day) & (last_day == day))
+            self._covers_block(masks, ranges, slice(day * DAY_BYTES, (day + 1) * DAY_BYTES), result)
+        spanning = np.flatnonzero(first_day != last_day)
+        if len(spanning):
+            self._covers_block(masks, spanning, slice(0, masks.shape[1]), result)
+        return result
+
+    def _covers_block(self, masks: np.ndarray, ranges: np.ndarray, byte_slice: slice, result: np.ndarray) -> None:
+        if not len(ranges):
+            return
+        bits = self.bits[:, byte_slice]
+        wanted = masks[ranges][:, byte_slice]
+        block = max(1, COVERS_BLOCK_BYTES // max(1, wanted.size))
+        for start in range(0, len(bits), block):
+            chunk = bits[start:start + block]
+            result[start:start + block, ranges] = ((chunk[:, None, :] & wanted[None, :, :]) == wanted[None, :, :]).all(axis=2)
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Benchmark the assignment pipeline on synthetic rosters.
+
+For each size (leaders x events) a roster CSV in the same format as the real
+simplified roster and a matching event schedule are generated, then every
+pipeline stage is run on them:
+
+    parse_leaders_csv        read the roster CSV
+    schedule_event_leaders   greedy assignment (and the optimal engine with --optimal)
+    output_assignments_to_csv
+    generate_meal_eligibility
+
+Wall time, peak traced memory and coverage metrics are recorded for each
+stage and written as JSON, so two runs can be compared with --compare.
+Everything runs offline in a temporary directory.
+
+Usage:
+    python scripts/benchmark_pipeline.py                              # default sizes
+    python scripts/benchmark_pipeline.py --sizes 100x50 50000x5000    # leaders x events
+    python scripts/benchmark_pipeline.py --output new.json --compare old.json
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from assignment import output_assignments_to_csv, parse_leaders_csv, schedule_event_leaders
+
+# Same dates as the real orientation
+DATES = ["Aug 25", "Aug 26", "Aug 27", "Aug 28", "Aug 29", "Aug 30", "Aug 31", "Sept 1"]
+
+# Availability values and how often they appear in the real roster
+AVAILABILITY_WEIGHTS = {
+    "all-day": 0.64,
+    "afternoon": 0.10,
+    "Morning": 0.09,
+    "unavailable": 0.08,
+    "evening": 0.05,
+    "Evening": 0.03,
+    "all-dau": 0.01,
+}
+
+# Real events take about ten leader seats per leader on the roster
+SEATS_PER_LEADER = 10
+
+# About one real event in six is a meal, starting in a lunch or dinner window
+MEAL_SHARE = 8 / 45
+MEAL_WINDOWS = [(11 * 60, 13 * 60), (16 * 60 + 30, 18 * 60 + 30)]
+
+DEFAULT_SIZES = ["100x50", "1000x200", "5000x1000"]
+
+ROSTER_FILE = "Trinity College Orientation Leaders 2025(Simplified).csv"
+
+
+def format_time(minutes: int) -> str:
+    hour, minute = divmod(minutes, 60)
+    return f"{hour % 12 or 12}:{minute:02d}{'am' if hour < 12 else 'pm'}"
+
+
+def generate_roster(num_leaders: int, seed: int = 0) -> pd.DataFrame:
+    """Roster in the simplified CSV format with realistic availability strings"""
+    rng = random.Random(seed)
+    values = list(AVAILABILITY_WEIGHTS)
+    weights = list(AVAILABILITY_WEIGHTS.values())
+
+    rows = []
+    for i in range(num_leaders):
+        # Most leaders fill in every day, some skip a few, a handful leave it blank
+        if rng.random() < 0.01:
+            availability = "No availability specified"
+        else:
+            pairs = [f"{date}: {rng.choices(values, weights)[0]}" for date in DATES if rng.random() < 0.95]
+            availability = " | ".join(pairs) if pairs else "No availability specified"
+        rows.append({
+            "First Name": f"Leader{i}",
+            "Last Name": f"Synthetic{i % 97}",
+            "Email": f"leader{i}@mail.example.com",
+            "Availability": availability
+        })
+    return pd.DataFrame(rows)
+
+
+def generate_events(num_events: int, num_leaders: int, seed: int = 0) -> Dict[str, Dict]:
+    """
+    Event schedule shaped like ORIENTATION_EVENTS: mostly on the first five
+    days, on a 15-minute grid between 8am and 11pm, half an hour to four
+    hours long, with headcounts scaled so demand tracks the roster size.
+    A MEAL_SHARE of them are meals of half an hour to an hour and a half
+    at lunch or dinner time, so meal eligibility grows with the schedule.
+    """
+    rng = random.Random(seed + 1)
+    date_weights = [7, 7, 9, 10, 8, 2, 2, 1]
+    mean_needed = max(1, SEATS_PER_LEADER * num_leaders // max(num_events, 1))
+
+    events = {}
+    for j in range(num_events):
+        is_meal = rng.random() < MEAL_SHARE
+        if is_meal:
+            duration = rng.choice([30, 60, 75, 90])
+            start = rng.randrange(*rng.choice(MEAL_WINDOWS), 15)
+        else:
+            duration = rng.choice([30, 60, 75, 90, 120, 150, 180, 240])
+            start = rng.randrange(8 * 60, 23 * 60 - duration + 1, 15)
+        events[f"Synthetic Event {j}"] = {
+            "date": rng.choices(DATES, date_weights)[0],
+            "start_time": format_time(start),
+            "end_time": format_time(start + duration),
+            "leaders_needed": max(1, int(mean_needed * rng.uniform(0.3, 1.7))),
+            "location": "Synthetic",
+            "is_meal": is_meal,
+            "is_core": False,
+            "is_indoor": True,
+            "is_outdoor": False
+        }
+    return events
+
+
+def parse_size(size: str) -> Tuple[int, int]:
+    leaders, _, events = size.lower().partition("x")
+    return int(leaders), int(events)
+
+
+def measure(func: Callable, trace_memory: bool = True, repeat: int = 1):
+    """
+    Run func, returning (result, stats). Wall time is the best of `repeat`
+    untraced runs; peak memory comes from one extra run under tracemalloc.
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    stats = {"seconds": round(best, 4)}
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        stats["peak_memory_mb"] = round(peak / 2 ** 20, 2)
+    return result, stats
+
+
+def coverage_metrics(result: Dict) -> Dict:
+    summary = result["scheduling_summary"]
+    return {
+        "assignments": sum(len(assignments) for assignments in result["leader_assignments"].values()),
+        "fully_staffed_events": len(summary["fully_staffed_events"]),
+        "understaffed_events": len(summary["understaffed_events"]),
+        "critically_understaffed_events": len(summary["critically_understaffed_events"]),
+        "unassigned_leaders": len(summary["unassigned_leaders"]),
+        "avg_staffing_percentage": summary["staffing_metrics"]["avg_staffing_percentage"],
+        "total_assignment_hours": summary["total_assignment_hours"],
+        "max_hours_assigned": summary["labor_compliance"]["max_hours_assigned"],
+        "time_conflicts": len(result["time_conflicts"])
+    }
+
+
+def benchmark_size(num_leaders: int, num_events: int, seed: int = 0, trace_memory: bool = True,
+                   repeat: int = 1, optimal: bool = False, time_limit: float = 10.0) -> Dict:
+    """Run every pipeline stage on one synthetic roster and schedule"""
+    from generate_meal_eligibility import generate_meal_eligibility
+
+    stages = {}
+    metrics = {}
+    original_dir = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix="benchmark-") as work_dir:
+        roster_file = os.path.join(work_dir, ROSTER_FILE)
+        generate_roster(num_leaders, seed).to_csv(roster_file, index=False)
+        events = generate_events(num_events, num_leaders, seed)
+        meal_events = {name: event for name, event in events.items() if event["is_meal"]}
+
+        leaders, stages["parse_leaders_csv"] = measure(
+            lambda: parse_leaders_csv(roster_file), trace_memory, repeat
+        )
+
+        result, stages["schedule_event_leaders"] = measure(
+            lambda: schedule_event_leaders(leaders, events), trace_memory, repeat
+        )
+        metrics["greedy"] = coverage_metrics(result)
+
+        if optimal:
+            from optimal_assignment import schedule_event_leaders_optimal
+            optimal_result, stages["schedule_event_leaders_optimal"] = measure(
+                lambda: schedule_event_leaders_optimal(leaders, events, time_limit=time_limit), False, 1
+            )
+            metrics["optimal"] = coverage_metrics(optimal_result)
+
+        backend_dir = os.path.join(work_dir, "backend")
+        os.makedirs(backend_dir)
+        _, stages["output_assignments_to_csv"] = measure(
+            lambda: output_assignments_to_csv(result, os.path.join(work_dir, "orientation_assignments"), backend_dir),
+            trace_memory, repeat
+        )
+
+        # The generator reads and writes its files in the working directory
+        os.chdir(backend_dir)
+        try:
+            _, stages["generate_meal_eligibility"] = measure(
+                lambda: generate_meal_eligibility(meal_events), trace_memory, repeat
+            )
+            metrics["meal_events"] = len(meal_events)
+            meal_file = "enhanced_orientation_assignments_meal_eligibility.csv"
+            metrics["meal_eligibility_records"] = len(pd.read_csv(meal_file)) if os.path.exists(meal_file) else 0
+        finally:
+            os.chdir(original_dir)
+
+    return {
+        "size": f"{num_leaders}x{num_events}",
+        "leaders": num_leaders,
+        "events": num_events,
+        "seed": seed,
+        "stages": stages,
+        "metrics": metrics
+    }
+
+
+def compare_runs(current: Dict, previous: Dict) -> List[str]:
+    """Lines comparing stage times of two result files, for sizes present in both"""
+    previous_runs = {run["size"]: run for run in previous.get("runs", [])}
+    lines = []
+    for run in current["runs"]:
+        before = previous_runs.get(run["size"])
+        if before is None:
+            continue
+        for stage, stats in run["stages"].items():
+            old = before["stages"].get(stage)
+            if not old or not old["seconds"]:
+                continue
+            ratio = stats["seconds"] / old["seconds"]
+            lines.append(f"{run['size']:>12}  {stage:<32} {old['seconds']:>9.3f}s -> {stats['seconds']:>9.3f}s  x{ratio:.2f}")
+    return lines
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the assignment pipeline on synthetic data")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES,
+                        help="roster sizes as LEADERSxEVENTS, e.g. 100x50 50000x5000 (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic data")
+    parser.add_argument("--repeat", type=int, default=1, help="time each stage as the best of N runs")
+    parser.add_argument("--no-memory", action="store_true", help="skip the extra traced run that measures peak memory")
+    parser.add_argument("--optimal", action="store_true", help="also time the optimal engine (needs scipy)")
+    parser.add_argument("--time-limit", type=float, default=10.0, help="time limit for the optimal engine")
+    parser.add_argument("--output", default="benchmark_results.json", help="where to write the results (default: %(default)s)")
+    parser.add_argument("--compare", help="previous results file to compare stage times against")
+    args = parser.parse_args()
+
+    try:
+        sizes = [parse_size(size) for size in args.sizes]
+    except ValueError:
+        parser.error("sizes must look like 1000x200")
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "runs": []
+    }
+
+    for num_leaders, num_events in sizes:
+        print(f"Benchmarking {num_leaders} leaders x {num_events} events...")
+        run = benchmark_size(num_leaders, num_events, args.seed, not args.no_memory, args.repeat,
+                             args.optimal, args.time_limit)
+        report["runs"].append(run)
+        for stage, stats in run["stages"].items():
+            memory = f"  peak {stats['peak_memory_mb']:.1f} MB" if "peak_memory_mb" in stats else ""
+            print(f"  {stage:<32} {stats['seconds']:>9.3f}s{memory}")
+        greedy = run["metrics"]["greedy"]
+        print(f"  coverage: {greedy['fully_staffed_events']}/{num_events} fully staffed, "
+              f"{greedy['avg_staffing_percentage']}% average, {greedy['unassigned_leaders']} leaders unassigned")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to: {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        print(f"\nCompared with {args.compare} ({previous.get('created_at', 'unknown date')}):")
+        for line in compare_runs(report, previous):
+            print(line)
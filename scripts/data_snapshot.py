@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Binary snapshot of the assignment outputs for fast API startup.
+
+The snapshot bundles the enhanced assignment CSVs and the leader roster
+into one file with typed columns (event, email, date and time columns are
+categoricals). It is written with pickle protocol 5 using out-of-band
+buffers, so numeric column data is stored as raw aligned arrays that the
+reader maps straight from the file instead of parsing or copying them.
+
+Layout:
+    magic | aligned column buffers | frames pickle | meta pickle | trailer
+
+The meta block records the size, modification time and digest of every
+source CSV, so a snapshot that is older than the CSVs next to it is ignored
+and callers fall back to CSV. A CSV is only re-hashed when its size or
+modification time differ from the recorded ones.
+
+The snapshot is unpickled, so it must only ever be written by this module:
+treat the data directory as trusted, like the code next to it.
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from datetime import datetime
+
+import pandas as pd
+
+SNAPSHOT_FILE = "enhanced_orientation_assignments_snapshot.bin"
+SNAPSHOT_FORMAT = 2
+MAGIC = b"TCOSNAP1"
+TRAILER = struct.Struct("<QQQQ")
+ALIGNMENT = 64
+
+# Frame name -> source CSV
+SOURCE_FILES = {
+    "assignments": "enhanced_orientation_assignments_leader_assignments.csv",
+    "events": "enhanced_orientation_assignments_event_staffing.csv",
+    "summary": "enhanced_orientation_assignments_summary.csv",
+    "meal_eligibility": "enhanced_orientation_assignments_meal_eligibility.csv",
+    "leaders": "Trinity College Orientation Leaders 2025(Simplified).csv",
+}
+
+# Repeated string columns stored as categoricals
+CATEGORICAL_COLUMNS = {
+    "assignments": ["Leader Email", "Event", "Date", "Start Time", "End Time"],
+    "meal_eligibility": ["Meal Event", "Eligible Leader", "Reason"],
+}
+
+
+def file_digest(path: str) -> str:
+    """Content digest of a file"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_source(path: str):
+    """(size, mtime in ns, digest) of a source file, as recorded in the snapshot"""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns, file_digest(path)
+
+
+def source_changed(path: str, recorded) -> bool:
+    """Whether the file at path differs from the recorded (size, mtime, digest)"""
+    size, mtime_ns, digest = recorded
+    stat = os.stat(path)
+    if stat.st_size != size:
+        return True
+    if stat.st_mtime_ns == mtime_ns:
+        return False
+    # Touched or copied, e.g. by a checkout: compare the contents
+    return file_digest(path) != digest
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_snapshot(base_dir: str) -> str:
+    """
+    Read the source CSVs in base_dir and write the snapshot next to them.
+
+    The file is written to a temporary name and atomically renamed, so a
+    reader never sees a partial snapshot and existing memory maps of the
+    previous file stay valid.
+    """
+    frames = {}
+    sources = {}
+    for name, filename in SOURCE_FILES.items():
+        path = os.path.join(base_dir, filename)
+        if not os.path.exists(path):
+            continue
+        df = pd.read_csv(path)
+        for column in CATEGORICAL_COLUMNS.get(name, []):
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+        frames[name] = df
+        sources[filename] = file_source(path)
+
+    buffers = []
+    frames_bytes = pickle.dumps(frames, protocol=5, buffer_callback=buffers.append)
+
+    fd, tmp_path = tempfile.mkstemp(dir=base_dir, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            layout = []
+            for buffer in buffers:
+                raw = buffer.raw()
+                offset = _align(f.tell())
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(raw)
+                layout.append((offset, raw.nbytes))
+
+            frames_offset = f.tell()
+            f.write(frames_bytes)
+
+            meta = {
+                "format": SNAPSHOT_FORMAT,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "sources": sources,
+                "buffers": layout,
+            }
+            meta_bytes = pickle.dumps(meta, protocol=5)
+            meta_offset = f.tell()
+            f.write(meta_bytes)
+            f.write(TRAILER.pack(frames_offset, len(frames_bytes), meta_offset, len(meta_bytes)))
+        output_file = os.path.join(base_dir, SNAPSHOT_FILE)
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return output_file
+
+
+def read_snapshot(base_dir: str):
+    """
+    Load the snapshot in base_dir, memory-mapping its column buffers.
+
+    Returns a dict of DataFrames keyed like SOURCE_FILES, or None if there
+    is no snapshot, it has an unknown format, or any source CSV present in
+    base_dir has changed since it was written. The returned frames may be
+    backed by read-only memory; copy a frame before modifying it.
+    """
+    path = os.path.join(base_dir, SNAPSHOT_FILE)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    if len(view) < len(MAGIC) + TRAILER.size or bytes(view[:len(MAGIC)]) != MAGIC:
+        return None
+
+    frames_offset, frames_len, meta_offset, meta_len = TRAILER.unpack(view[-TRAILER.size:])
+    # pickle can run arbitrary code; the snapshot is trusted because only
+    # write_snapshot creates it, in the data directory the API is deployed with
+    meta = pickle.loads(view[meta_offset:meta_offset + meta_len])
+    if meta.get("format") != SNAPSHOT_FORMAT:
+        return None
+
+    # Stale if any CSV next to the snapshot differs from the one it was built from
+    for filename, recorded in meta["sources"].items():
+        source_path = os.path.join(base_dir, filename)
+        if os.path.exists(source_path) and source_changed(source_path, recorded):
+            return None
+
+    buffers = [view[offset:offset + length] for offset, length in meta["buffers"]]
+    return pickle.loads(view[frames_offset:frames_offset + frames_len], buffers=buffers)
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Default to the directory the API reads its data from
+    if len(sys.argv) > 1:
+        data_dir = sys.argv[1]
+    else:
+        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        data_dir = os.path.join(parent_dir, "backend")
+        if not os.path.isdir(data_dir):
+            data_dir = parent_dir
+
+    output = write_snapshot(data_dir)
+    print(f"Snapshot saved to: {output}")
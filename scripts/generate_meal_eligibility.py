@@ -5,145 +5,132 @@ Leaders are eligible for meals if they work during meal times or adjacent shifts
 """
 
 import pandas as pd
+import numpy as np
 import os
-from datetime import datetime, timedelta
+from typing import Dict, Optional
 
-def parse_time(time_str):
-    """Parse time string like '12:30pm' into datetime object"""
+try:
+    from times import time_to_minutes, times_to_minutes
+except ImportError:  # imported as scripts.generate_meal_eligibility
+    from scripts.times import time_to_minutes, times_to_minutes
+
+# Shifts ending or starting within this many minutes of a meal count as adjacent
+ADJACENT_SHIFT_MINUTES = 2 * 60
+
+REASONS = ["Working during meal time", "Working adjacent shift"]
+
+ELIGIBILITY_COLUMNS = ['Meal Event', 'Eligible Leader', 'Reason']
+
+def minutes_column(df: pd.DataFrame, minutes_column: str, time_column: str) -> np.ndarray:
+    """The precomputed minutes column of df if present, else its time column parsed"""
+    if minutes_column in df.columns:
+        return df[minutes_column].to_numpy(dtype=np.int64)
+    return times_to_minutes(df[time_column])
+
+def load_meal_events() -> Dict[str, Dict]:
+    """The is_meal events of the orientation schedule"""
     try:
-        return datetime.strptime(time_str.replace(' ', ''), '%I:%M%p')
-    except:
-        return datetime.strptime(time_str.replace(' ', ''), '%I%p')
+        from orientation_schedule import get_meal_events
+    except ImportError:  # imported as scripts.generate_meal_eligibility
+        from scripts.orientation_schedule import get_meal_events
+    return get_meal_events()
+
+def compute_meal_eligibility(df: pd.DataFrame, meal_events: Dict[str, Dict]) -> pd.DataFrame:
+    """
+    Eligibility table for the assignments in df (columns 'Leader Email',
+    'Date', 'Start Time', 'End Time') and meal_events (name -> dict with
+    'date', 'start_time' and 'end_time', as in ORIENTATION_EVENTS). If df
+    already has integer 'Start Minutes' / 'End Minutes' columns, as the
+    API's assignments do, those are used instead of parsing the times.
+
+    Every meal is joined with the assignments on its date and both reasons
+    are tested for all pairs at once. Rows come out grouped by meal in
+    meal_events order, then in assignment order, with one row per meal,
+    leader and reason.
+    """
+    if df.empty or not meal_events:
+        return pd.DataFrame(columns=ELIGIBILITY_COLUMNS)
+
+    meal_names = list(meal_events)
+    meals = pd.DataFrame({
+        'meal': np.arange(len(meal_names)),
+        'Date': [meal["date"] for meal in meal_events.values()],
+        'meal_start': [time_to_minutes(meal["start_time"]) for meal in meal_events.values()],
+        'meal_end': [time_to_minutes(meal["end_time"]) for meal in meal_events.values()]
+    })
+
+    leader_codes, leaders = pd.factorize(df['Leader Email'])
+    assignments = pd.DataFrame({
+        'row': np.arange(len(df)),
+        'Date': df['Date'].to_numpy(),
+        'leader': leader_codes,
+        'start': minutes_column(df, 'Start Minutes', 'Start Time'),
+        'end': minutes_column(df, 'End Minutes', 'End Time')
+    })
+
+    # Every (meal, assignment) pair on the same date
+    pairs = meals.merge(assignments, on='Date').sort_values(['meal', 'row'], kind='stable')
+    meal_start = pairs['meal_start'].to_numpy()
+    meal_end = pairs['meal_end'].to_numpy()
+    start = pairs['start'].to_numpy()
+    end = pairs['end'].to_numpy()
+
+    # Working during meal time: the shift covers the meal's start or its end
+    during = ((start <= meal_start) & (meal_start < end)) | ((start < meal_end) & (meal_end <= end))
+    # Working adjacent shift: ends near the meal's start or starts near its end
+    adjacent = (
+        (np.abs(end - meal_start) <= ADJACENT_SHIFT_MINUTES)
+        | (np.abs(meal_end - start) <= ADJACENT_SHIFT_MINUTES)
+    )
+    eligible = during | adjacent
+
+    eligible_pairs = pd.DataFrame({
+        'meal': pairs['meal'].to_numpy()[eligible],
+        'leader': pairs['leader'].to_numpy()[eligible],
+        'reason': np.where(during[eligible], 0, 1)
+    }).drop_duplicates()
+
+    return pd.DataFrame({
+        'Meal Event': np.array(meal_names, dtype=object)[eligible_pairs['meal'].to_numpy()],
+        'Eligible Leader': np.asarray(leaders, dtype=object)[eligible_pairs['leader'].to_numpy()],
+        'Reason': np.array(REASONS, dtype=object)[eligible_pairs['reason'].to_numpy()]
+    })
+
+def generate_meal_eligibility(meal_events: Optional[Dict[str, Dict]] = None):
+    """Generate meal eligibility based on the new assignments and the schedule's meals"""
 
-def generate_meal_eligibility():
-    """Generate meal eligibility based on the new assignments"""
-    
     # Load the assignment data
     assignments_file = "enhanced_orientation_assignments_leader_assignments.csv"
     if not os.path.exists(assignments_file):
         print(f"Error: Could not find {assignments_file}")
         return False
-    
+
     df = pd.read_csv(assignments_file)
-    
-    # Define meal events with their times
-    meal_events = {
-        "Dean's Lunch": {
-            "date": "Aug 25",
-            "start_time": "12:30pm",
-            "end_time": "1:45pm"
-        },
-        "Dinner": {
-            "date": "Aug 25", 
-            "start_time": "8:30pm",
-            "end_time": "10:00pm"
-        },
-        "Breakfast": {
-            "date": "Aug 26",
-            "start_time": "8:00am", 
-            "end_time": "9:30am"
-        },
-        "Lunch": {
-            "date": "Aug 26",
-            "start_time": "12:00pm",
-            "end_time": "1:30pm"
-        },
-        "Dinner (Aug 26)": {
-            "date": "Aug 26",
-            "start_time": "6:00pm",
-            "end_time": "7:30pm"
-        },
-        "Breakfast (Aug 27)": {
-            "date": "Aug 27",
-            "start_time": "8:00am",
-            "end_time": "9:30am"
-        },
-        "Lunch (Aug 27)": {
-            "date": "Aug 27", 
-            "start_time": "12:00pm",
-            "end_time": "1:30pm"
-        },
-        "Dinner (Aug 27)": {
-            "date": "Aug 27",
-            "start_time": "6:00pm", 
-            "end_time": "7:30pm"
-        },
-        "Breakfast (Aug 28)": {
-            "date": "Aug 28",
-            "start_time": "8:00am",
-            "end_time": "9:30am"
-        },
-        "Lunch (Aug 28)": {
-            "date": "Aug 28",
-            "start_time": "12:00pm",
-            "end_time": "1:30pm"
-        }
-    }
-    
-    eligibility_records = []
-    
-    # For each meal event, find eligible leaders
-    for meal_name, meal_info in meal_events.items():
-        meal_date = meal_info["date"]
-        meal_start = parse_time(meal_info["start_time"])
-        meal_end = parse_time(meal_info["end_time"])
-        
-        # Find leaders working on the same date
-        date_assignments = df[df['Date'] == meal_date]
-        
-        for _, assignment in date_assignments.iterrows():
-            leader_email = assignment['Leader Email']
-            event_start = parse_time(assignment['Start Time'])
-            event_end = parse_time(assignment['End Time'])
-            
-            # Check if leader is working during meal time or adjacent shifts
-            eligible = False
-            reason = ""
-            
-            # Working during meal time
-            if (event_start <= meal_start < event_end) or (event_start < meal_end <= event_end):
-                eligible = True
-                reason = "Working during meal time"
-            
-            # Working adjacent shift (within 2 hours before or after)
-            elif abs((event_end - meal_start).total_seconds()) <= 2 * 3600:  # 2 hours
-                eligible = True
-                reason = "Working adjacent shift"
-            elif abs((meal_end - event_start).total_seconds()) <= 2 * 3600:  # 2 hours
-                eligible = True
-                reason = "Working adjacent shift"
-            
-            if eligible:
-                eligibility_records.append({
-                    'Meal Event': meal_name,
-                    'Eligible Leader': leader_email,
-                    'Reason': reason
-                })
-    
-    # Remove duplicates
-    eligibility_df = pd.DataFrame(eligibility_records)
-    eligibility_df = eligibility_df.drop_duplicates()
-    
+
+    if meal_events is None:
+        meal_events = load_meal_events()
+    eligibility_df = compute_meal_eligibility(df, meal_events)
+
     # Save to CSV
     output_file = "enhanced_orientation_assignments_meal_eligibility.csv"
     eligibility_df.to_csv(output_file, index=False)
-    
+
     print(f"Generated meal eligibility data: {output_file}")
     print(f"Total eligibility records: {len(eligibility_df)}")
     print(f"Unique leaders eligible for meals: {eligibility_df['Eligible Leader'].nunique()}")
     print(f"Meal events covered: {eligibility_df['Meal Event'].nunique()}")
-    
+
     return True
 
 if __name__ == "__main__":
     print("Generating Meal Eligibility Data")
     print("=" * 40)
-    
+
     # Change to the correct directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
     parent_dir = os.path.dirname(script_dir)
     os.chdir(parent_dir)
-    
+
     success = generate_meal_eligibility()
     if success:
         print("✅ Meal eligibility generation completed successfully!")
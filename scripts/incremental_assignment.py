@@ -0,0 +1,113 @@
+"""
+Incremental re-assignment for orientation leaders.
+
+Instead of rescheduling everyone, start from the published assignments and
+repair them against the current roster and events:
+
+    1. keep every existing assignment that is still valid: the leader is
+       still on the roster and available, the event still exists, and it
+       does not overlap another kept shift, push the leader over the hour
+       cap or exceed the event's (possibly reduced) headcount
+    2. fill the seats that opened up with the greedy round-robin from
+       assignment.py, which only ever adds leaders
+
+So a leader dropping out, a change of availability, or an event moving or
+changing its headcount only touches the affected shifts; everybody else
+keeps what they were told. Run through assignment.py:
+    python scripts/assignment.py --engine incremental
+"""
+
+import os
+from typing import Dict, List
+
+import pandas as pd
+
+from assignment import (
+    ScheduleState,
+    SchedulingProblem,
+    fill_round_robin,
+    staffing_targets,
+    summarize_schedule,
+)
+
+ASSIGNMENTS_FILE = "enhanced_orientation_assignments_leader_assignments.csv"
+
+
+def load_assignments_csv(path: str) -> List[Dict]:
+    """Existing assignments as rows of email, event and the time it was published with, in file order"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No existing assignments at {path}; run a full assignment first")
+    df = pd.read_csv(path, usecols=["Leader Email", "Event", "Date", "Start Time", "End Time"])
+    return [
+        {"email": email, "event": event, "date": date, "start_time": start, "end_time": end}
+        for email, event, date, start, end in zip(
+            df["Leader Email"], df["Event"], df["Date"], df["Start Time"], df["End Time"]
+        )
+    ]
+
+
+def event_moved(row: Dict, events: Dict[str, Dict]) -> bool:
+    """Whether the event in an existing row has changed date or time since it was assigned"""
+    event = events.get(row["event"])
+    if event is None or "date" not in row:
+        return False
+    return (row["date"], row["start_time"], row["end_time"]) != (event["date"], event["start_time"], event["end_time"])
+
+
+def repair_assignments(leaders: List[Dict], events: Dict[str, Dict], existing: List[Dict]) -> Dict:
+    """
+    Reconcile existing assignments with the current leaders and events.
+
+    Returns the same structure as assignment.schedule_event_leaders, plus a
+    "reassignment" entry listing what was kept, removed (with the reason)
+    and added.
+    """
+    problem = SchedulingProblem(leaders, events)
+    event_index = {name: j for j, name in enumerate(problem.event_names)}
+    state = ScheduleState(problem, events)
+
+    # Shifts that moved lose to unchanged ones when the two now overlap
+    removed = []
+    for row in sorted(existing, key=lambda row: event_moved(row, events)):
+        leader = problem.leader_index.get(row["email"])
+        event = event_index.get(row["event"])
+
+        if leader is None:
+            reason = "Leader no longer on roster"
+        elif event is None:
+            reason = "Event no longer scheduled"
+        elif state.assigned_counts[event] >= problem.needed[event]:
+            reason = "Event headcount reduced"
+        elif not problem.eligible_by_event[event, leader]:
+            reason = "Leader no longer available"
+        elif not state.candidate_row(event)[leader]:
+            reason = "Conflicts with another shift"
+        elif not state.can_assign(leader, event):
+            reason = "Over the hour cap"
+        else:
+            state.assign(leader, event)
+            continue
+        removed.append({"email": row["email"], "event": row["event"], "reason": reason})
+
+    kept = {(email, assignment["event"])
+            for email, assignments in state.leader_assignments.items() for assignment in assignments}
+
+    # Only events that are now short get new leaders
+    targets = [max(target, count) for target, count in zip(staffing_targets(problem), state.assigned_counts)]
+    fill_round_robin(state, targets)
+
+    added = [
+        {"email": email, "event": assignment["event"]}
+        for email, assignments in state.leader_assignments.items()
+        for assignment in assignments
+        if (email, assignment["event"]) not in kept
+    ]
+
+    result = summarize_schedule(leaders, events, state.leader_assignments, state.leader_hours(), state.event_staffing,
+                                problem.max_hours)
+    result["reassignment"] = {
+        "kept": len(kept),
+        "removed": removed,
+        "added": added
+    }
+    return result
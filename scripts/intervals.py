@@ -0,0 +1,95 @@
+"""
+Per-date sorted interval sets for detecting schedule conflicts.
+
+Times are minutes since midnight and intervals are half-open, so an event
+ending at 2:00pm does not conflict with one starting at 2:00pm.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# (start, end, label) of one interval
+Interval = Tuple[int, int, Hashable]
+
+# (label, overlap start, overlap end) of an interval hit by a query
+Overlap = Tuple[Hashable, int, int]
+
+# (label of the earlier-starting interval, label of the other, overlap start, overlap end)
+Conflict = Tuple[Hashable, Hashable, int, int]
+
+
+class IntervalSchedule:
+    """
+    Intervals grouped by date.
+
+    Adding is an append. The first query after a change sorts that date by
+    start time and records, for every prefix of the sorted intervals, the
+    latest end and the interval it belongs to. An overlap query is then one
+    bisect: the intervals starting before the query ends are a prefix, and
+    one of them overlaps exactly when the prefix's latest end is after the
+    query starts. Building costs O(k log k) per date, queries O(log k).
+    """
+
+    def __init__(self):
+        self._by_date: Dict[Hashable, List[Interval]] = {}
+        # date -> (starts, latest end of each prefix, index of the interval ending then)
+        self._index: Dict[Hashable, Tuple[List[int], List[int], List[int]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(intervals) for intervals in self._by_date.values())
+
+    def add(self, date: Hashable, start: int, end: int, label: Hashable) -> None:
+        self._by_date.setdefault(date, []).append((start, end, label))
+        self._index.pop(date, None)
+
+    def _sorted(self, date: Hashable) -> List[Interval]:
+        intervals = self._by_date[date]
+        if date not in self._index:
+            # Stable, so intervals with equal times keep the order they were added in
+            intervals.sort(key=lambda interval: interval[:2])
+            starts, reach, reach_at = [], [], []
+            for i, (start, end, _) in enumerate(intervals):
+                starts.append(start)
+                if reach and reach[-1] >= end:
+                    reach.append(reach[-1])
+                    reach_at.append(reach_at[-1])
+                else:
+                    reach.append(end)
+                    reach_at.append(i)
+            self._index[date] = (starts, reach, reach_at)
+        return intervals
+
+    def overlap(self, date: Hashable, start: int, end: int) -> Optional[Overlap]:
+        """
+        An interval on date overlapping [start, end), with the overlap
+        window, or None if nothing does. Of the overlapping intervals, the
+        one that runs latest is reported.
+        """
+        if date not in self._by_date:
+            return None
+        intervals = self._sorted(date)
+        starts, reach, reach_at = self._index[date]
+
+        i = bisect_left(starts, end) - 1
+        if i < 0 or reach[i] <= start:
+            return None
+        other_start, other_end, label = intervals[reach_at[i]]
+        return label, max(start, other_start), min(end, other_end)
+
+    def conflicts(self) -> List[Conflict]:
+        """
+        Every pair of overlapping intervals, by sweeping each date in start
+        order. The intervals still running are kept in start order, so each
+        new interval is paired with them as they are, without re-sorting:
+        O(k log k) per date plus the pairs found.
+        """
+        found = []
+        for date in self._by_date:
+            running: List[Interval] = []
+            for start, end, label in self._sorted(date):
+                # Intervals that ended by now never overlap a later one either
+                running = [interval for interval in running if interval[1] > start]
+                for other_start, other_end, other_label in running:
+                    found.append((other_label, label, start, min(end, other_end)))
+                running.append((start, end, label))
+        return found
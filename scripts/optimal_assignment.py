@@ -0,0 +1,195 @@
+"""
+Optimal assignment engine for orientation leaders.
+
+Models the whole orientation week as one integer program instead of the
+greedy round-robin in assignment.py:
+
+    x[l, e]  1 if leader l works event e (only for eligible pairs)
+    y[e]     1 if event e has at least one leader
+    H        the largest number of hours any leader works
+
+    subject to sum_l x[l, e] <= needed[e]           (no overstaffing)
+               y[e] <= sum_l x[l, e]
+               sum_{e in C} x[l, e] <= 1             (no overlap, per clique C)
+               sum_e hours[e] * x[l, e] <= H <= cap  (hour cap)
+
+It is solved lexicographically in two phases:
+
+    1. maximize coverage = sum x[l, e] / needed[e] + FIRST_LEADER_BONUS * sum y[e]
+    2. minimize H while keeping the coverage found in phase 1
+
+Coverage is measured as the staffed fraction of each event, so phase 1
+maximizes the average staffing percentage; the bonus makes sure every event
+that can be staffed gets a leader first. Phase 1 is fast; phase 2 balances
+hours within whatever is left of the time limit and is skipped (keeping the
+phase 1 solution) if it finds nothing better in time.
+
+Requires scipy (HiGHS via scipy.optimize.milp). Run through assignment.py:
+    python scripts/assignment.py --engine optimal --time-limit 10
+"""
+
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from assignment import (
+    MAX_LEADER_HOURS,
+    SchedulingProblem,
+    assignment_record,
+    new_event_staffing,
+    summarize_schedule,
+)
+from availability import AvailabilityMatrix
+
+try:
+    from scipy.optimize import Bounds, LinearConstraint, milp
+    from scipy.sparse import csr_array
+except ImportError:  # optional, only needed for this engine
+    milp = None
+
+# One event going from unstaffed to staffed outweighs any single extra leader
+FIRST_LEADER_BONUS = 1.0
+
+# Relative slack on the phase 1 coverage when balancing hours in phase 2
+COVERAGE_TOLERANCE = 1e-9
+
+# Peak hours within this fraction of the proven bound are good enough
+BALANCE_GAP = 0.05
+
+DEFAULT_TIME_LIMIT = 10.0
+
+
+def overlap_cliques(problem: SchedulingProblem) -> List[np.ndarray]:
+    """
+    Groups of mutually overlapping events covering every overlapping pair.
+
+    For each event, the events that overlap it and start no later than it
+    all contain its start time, so they pairwise overlap. Every overlapping
+    pair appears in the group of whichever event starts later.
+    """
+    cliques = {}
+    for e in range(len(problem.event_names)):
+        members = np.flatnonzero(problem.overlaps[e] & (problem.event_start <= problem.event_start[e]))
+        if len(members) > 1:
+            cliques.setdefault(members.tobytes(), members)
+    return list(cliques.values())
+
+
+def schedule_event_leaders_optimal(leaders: List[Dict], events: Dict[str, Dict],
+                                   time_limit: float = DEFAULT_TIME_LIMIT, max_hours: float = MAX_LEADER_HOURS,
+                                   availability: AvailabilityMatrix = None) -> Dict:
+    """
+    Assign leaders by solving the integer program described above.
+
+    Returns the same structure as assignment.schedule_event_leaders. If the
+    time limit is reached, the best solution found so far is used.
+    """
+    started = time.monotonic()
+    if milp is None:
+        raise ImportError("The optimal engine requires scipy: pip install scipy")
+
+    problem = SchedulingProblem(leaders, events, max_hours, availability)
+    num_leaders = len(problem.emails)
+    num_events = len(problem.event_names)
+    needed = np.array(problem.needed, dtype=np.float64)
+
+    # One x variable per eligible (leader, event) pair, then y per event, then H
+    pair_leader, pair_event = np.nonzero(problem.eligible)
+    num_pairs = len(pair_leader)
+    num_vars = num_pairs + num_events + 1
+    h_var = num_vars - 1
+    pair_hours = problem.event_duration[pair_event]
+
+    coverage = np.zeros(num_vars)
+    coverage[:num_pairs] = 1.0 / np.maximum(needed[pair_event], 1)
+    coverage[num_pairs:h_var] = FIRST_LEADER_BONUS
+
+    rows, cols, values, lower, upper = [], [], [], [], []
+
+    def add_row(columns, coefficients, lo, hi):
+        rows.extend([len(lower)] * len(columns))
+        cols.extend(columns)
+        values.extend(coefficients)
+        lower.append(lo)
+        upper.append(hi)
+
+    pairs_by_event = [np.flatnonzero(pair_event == e) for e in range(num_events)]
+    pairs_by_leader = [np.flatnonzero(pair_leader == l) for l in range(num_leaders)]
+
+    for e, pairs in enumerate(pairs_by_event):
+        # Staff at most the number of leaders needed
+        add_row(pairs.tolist(), [1.0] * len(pairs), 0, needed[e])
+        # Covered only if somebody works it
+        add_row(pairs.tolist() + [num_pairs + e], [-1.0] * len(pairs) + [1.0], -np.inf, 0)
+
+    cliques = overlap_cliques(problem)
+    for l, pairs in enumerate(pairs_by_leader):
+        if not len(pairs):
+            continue
+        # Hours stay under both the cap and the balance variable
+        add_row(pairs.tolist() + [h_var], pair_hours[pairs].tolist() + [-1.0], -np.inf, 0)
+
+        # At most one event from every group of overlapping events
+        events_of_leader = pair_event[pairs]
+        for clique in cliques:
+            inside = pairs[np.isin(events_of_leader, clique)]
+            if len(inside) > 1:
+                add_row(inside.tolist(), [1.0] * len(inside), 0, 1)
+
+    constraints = [LinearConstraint(
+        csr_array((values, (rows, cols)), shape=(len(lower), num_vars)), lower, upper
+    )]
+    upper_bounds = np.ones(num_vars)
+    upper_bounds[h_var] = max_hours
+    integrality = np.ones(num_vars)
+    integrality[h_var] = 0
+    bounds = Bounds(np.zeros(num_vars), upper_bounds)
+
+    def solve(cost, extra_constraints=(), gap=1e-4):
+        remaining = max(time_limit - (time.monotonic() - started), 0.0)
+        return milp(
+            cost,
+            constraints=constraints + list(extra_constraints),
+            integrality=integrality,
+            bounds=bounds,
+            options={"time_limit": remaining, "mip_rel_gap": gap, "disp": False}
+        )
+
+    # Phase 1: best coverage
+    solution = solve(-coverage)
+    if solution.x is None:
+        raise RuntimeError(f"Optimal assignment failed: {solution.message}")
+    best_coverage = coverage @ solution.x
+
+    # Phase 2: lowest peak hours without giving up coverage
+    balance = np.zeros(num_vars)
+    balance[h_var] = 1.0
+    keep_coverage = LinearConstraint(
+        coverage.reshape(1, -1), best_coverage * (1 - COVERAGE_TOLERANCE), np.inf
+    )
+    balanced = solve(balance, [keep_coverage], gap=BALANCE_GAP)
+    if balanced.x is not None:
+        solution = balanced
+
+    chosen = np.flatnonzero(solution.x[:num_pairs] > 0.5)
+
+    # Each leader's events in schedule order; staffing lists in roster order
+    order = np.lexsort((problem.event_start[pair_event[chosen]],
+                        problem.event_date[pair_event[chosen]],
+                        pair_leader[chosen]))
+    leader_assignments = {email: [] for email in problem.emails}
+    leader_hours = {email: 0 for email in problem.emails}
+    event_staffing = new_event_staffing(events, problem)
+
+    for pair in chosen[order]:
+        email = problem.emails[pair_leader[pair]]
+        event_name = problem.event_names[pair_event[pair]]
+        hours = problem.durations[pair_event[pair]]
+
+        leader_assignments[email].append(assignment_record(events, event_name, hours))
+        leader_hours[email] += hours
+        event_staffing[event_name]["assigned_leaders"].append(email)
+        event_staffing[event_name]["leaders_assigned"] += 1
+
+    return summarize_schedule(leaders, events, leader_assignments, leader_hours, event_staffing, max_hours)
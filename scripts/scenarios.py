@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+What-if scenarios for the assignment engine.
+
+Runs a batch of scenarios, each a set of overrides on the real roster and
+schedule, across a process pool and prints one comparison row per scenario
+built from its scheduling summary.
+
+Scenarios are read from a JSON list, for example:
+
+    [
+        {"name": "baseline"},
+        {"name": "Closing needs 60", "leaders_needed": {"Closing Ceremony": 60}},
+        {"name": "40 hour cap", "max_hours": 40},
+        {"name": "Late mornings", "availability_windows": {"morning": ["9:00am", "12:00pm"]}},
+        {"name": "Optimal", "engine": "optimal", "time_limit": 5}
+    ]
+
+Supported keys: name, engine ("greedy" or "optimal"), time_limit,
+max_hours, leaders_needed (event name -> headcount) and
+availability_windows (availability value -> [start, end]). Windows are
+narrowed to the 15-minute slot grid, so "8:10am" starts at 8:15am.
+
+The roster is parsed and its availability bitmap built once in the parent.
+Workers are forked, so they share both copy-on-write instead of each
+re-reading the CSV; scenarios that change availability windows build their
+own bitmap.
+
+Usage:
+    python scripts/scenarios.py scenarios.json [--workers 4] [--output comparison.csv]
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from assignment import MAX_LEADER_HOURS, parse_leaders_csv, schedule_event_leaders, time_to_minutes
+from availability import AVAILABILITY_WINDOWS, AvailabilityMatrix
+
+ENGINES = ("greedy", "optimal")
+
+# Set in each worker (inherited on fork, pickled once per worker otherwise)
+_leaders = None
+_events = None
+_availability = None
+
+
+def apply_overrides(events: Dict[str, Dict], scenario: Dict) -> Dict[str, Dict]:
+    """Copy of events with the scenario's headcount overrides applied"""
+    overrides = scenario.get("leaders_needed", {})
+    unknown = set(overrides) - set(events)
+    if unknown:
+        raise ValueError(f"Unknown events in scenario {scenario.get('name')!r}: {', '.join(sorted(unknown))}")
+
+    return {
+        name: {**event, "leaders_needed": int(overrides[name])} if name in overrides else event
+        for name, event in events.items()
+    }
+
+
+def scenario_windows(scenario: Dict) -> Optional[Dict]:
+    """Availability windows with the scenario's overrides, or None if unchanged"""
+    overrides = scenario.get("availability_windows")
+    if not overrides:
+        return None
+    windows = dict(AVAILABILITY_WINDOWS)
+    for availability, (start, end) in overrides.items():
+        windows[availability.lower()] = (time_to_minutes(start), time_to_minutes(end))
+    return windows
+
+
+def scenario_metrics(scenario: Dict, result: Dict, elapsed: float) -> Dict:
+    """Comparison row for one scenario"""
+    summary = result["scheduling_summary"]
+    return {
+        "Scenario": scenario.get("name", ""),
+        "Engine": scenario.get("engine", "greedy"),
+        "Fully Staffed Events": len(summary["fully_staffed_events"]),
+        "Understaffed Events": len(summary["understaffed_events"]),
+        "Events Below 50% Staffed": summary["staffing_metrics"]["events_below_50_percent"],
+        "Average Staffing Percentage": summary["staffing_metrics"]["avg_staffing_percentage"],
+        "Minimum Staffing Percentage": summary["staffing_metrics"]["min_staffing_percentage"],
+        "Unassigned Leaders": len(summary["unassigned_leaders"]),
+        "Total Assignment Hours": summary["total_assignment_hours"],
+        "Average Hours Per Leader": summary["labor_compliance"]["avg_hours_per_leader"],
+        "Max Hours Assigned": summary["labor_compliance"]["max_hours_assigned"],
+        "Leaders Over Hour Cap": len(summary["labor_compliance"]["leaders_over_hour_cap"]),
+        "Time Conflicts": len(result["time_conflicts"]),
+        "Runtime (s)": round(elapsed, 3)
+    }
+
+
+def _init_worker(leaders: List[Dict], events: Dict[str, Dict], availability: AvailabilityMatrix) -> None:
+    global _leaders, _events, _availability
+    _leaders, _events, _availability = leaders, events, availability
+
+
+def run_scenario(scenario: Dict) -> Dict:
+    """Run one scenario against the worker's shared roster and events"""
+    started = time.perf_counter()
+    engine = scenario.get("engine", "greedy")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r} in scenario {scenario.get('name')!r}")
+
+    events = apply_overrides(_events, scenario)
+    max_hours = float(scenario.get("max_hours", MAX_LEADER_HOURS))
+    windows = scenario_windows(scenario)
+    availability = _availability
+    if windows is not None:
+        availability = AvailabilityMatrix(_leaders, availability.dates, windows)
+
+    if engine == "optimal":
+        from optimal_assignment import DEFAULT_TIME_LIMIT, schedule_event_leaders_optimal
+        result = schedule_event_leaders_optimal(
+            _leaders, events, time_limit=float(scenario.get("time_limit", DEFAULT_TIME_LIMIT)),
+            max_hours=max_hours, availability=availability
+        )
+    else:
+        result = schedule_event_leaders(_leaders, events, max_hours=max_hours, availability=availability)
+
+    return scenario_metrics(scenario, result, time.perf_counter() - started)
+
+
+def run_scenarios(leaders: List[Dict], events: Dict[str, Dict], scenarios: List[Dict],
+                  workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Run every scenario and return the comparison table, one row per
+    scenario in input order. workers=1 runs them in this process.
+    """
+    dates = dict.fromkeys(event["date"] for event in events.values())
+    availability = AvailabilityMatrix(leaders, dates)
+
+    workers = min(workers or os.cpu_count() or 1, len(scenarios)) or 1
+    if workers == 1:
+        _init_worker(leaders, events, availability)
+        rows = [run_scenario(scenario) for scenario in scenarios]
+    else:
+        # Forked workers inherit the parsed roster and bitmap without copying them
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(leaders, events, availability)) as pool:
+            rows = list(pool.map(run_scenario, scenarios))
+
+    return pd.DataFrame(rows).set_index("Scenario")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare what-if scenarios for the leader assignment")
+    parser.add_argument("scenarios", help="JSON file with a list of scenarios")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: one per CPU, at most one per scenario)")
+    parser.add_argument("--output", help="also save the comparison table to this CSV file")
+    args = parser.parse_args()
+
+    with open(args.scenarios) as f:
+        scenarios = json.load(f)
+
+    from orientation_schedule import ORIENTATION_EVENTS
+
+    # The roster lives in the repository root
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    leaders = parse_leaders_csv(os.path.join(parent_dir, "Trinity College Orientation Leaders 2025(Simplified).csv"))
+    print(f"Running {len(scenarios)} scenarios for {len(leaders)} leaders and {len(ORIENTATION_EVENTS)} events")
+
+    try:
+        comparison = run_scenarios(leaders, ORIENTATION_EVENTS, scenarios, args.workers)
+    except (ValueError, ImportError) as e:
+        parser.error(str(e))
+
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(comparison.to_string())
+
+    if args.output:
+        comparison.to_csv(args.output)
+        print(f"\nComparison saved to: {args.output}")
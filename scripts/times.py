@@ -0,0 +1,33 @@
+"""
+Parsing of the clock times used throughout the schedule ('1:45pm', '10am').
+
+Every script and the API convert times with these helpers, so they all agree
+on what a time string means.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+@lru_cache(maxsize=None)
+def time_to_minutes(time_str: str) -> int:
+    """Convert a time like '1:45pm', '10am' or '1:45 PM' into minutes since midnight"""
+    time_str = time_str.strip().lower().replace(' ', '')
+    meridiem = time_str[-2:]
+    if meridiem not in ('am', 'pm'):
+        raise ValueError(f"Unrecognized time: {time_str!r}")
+    hours, _, minutes = time_str[:-2].partition(':')
+    hour = int(hours) % 12 + (12 if meridiem == 'pm' else 0)
+    return hour * 60 + int(minutes or 0)
+
+
+def times_to_minutes(times: pd.Series) -> np.ndarray:
+    """Minutes since midnight for a column of time strings, parsing each distinct value once"""
+    if isinstance(times.dtype, pd.CategoricalDtype):
+        codes, uniques = times.cat.codes.to_numpy(), times.cat.categories
+    else:
+        codes, uniques = pd.factorize(times)
+    minutes = np.array([time_to_minutes(time_str) for time_str in uniques], dtype=np.int64)
+    return minutes[codes]